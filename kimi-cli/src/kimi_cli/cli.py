@@ -3,8 +3,9 @@ from __future__ import annotations
 import asyncio
 import json
 import sys
+from collections.abc import Callable
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import Annotated, Literal, cast
 
 import typer
 
@@ -34,6 +35,25 @@ def _version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def _shell_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """
+    Get the factory of the libuv based event loop (`uvloop`, or `winloop` on Windows) for the
+    interactive shell, if it is installed. Otherwise, the default event loop is used.
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as libuv_loop  # pyright: ignore[reportMissingImports]
+        else:
+            import uvloop as libuv_loop  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+    # neither module is a dependency, so their types are unknown to the type checker
+    return cast(
+        Callable[[], asyncio.AbstractEventLoop],
+        libuv_loop.new_event_loop,  # pyright: ignore[reportUnknownMemberType]
+    )
+
+
 @cli.callback(invoke_without_command=True)
 def kimi(
     ctx: typer.Context,
@@ -213,6 +233,7 @@ def kimi(
     from kimi_cli.app import KimiCLI, enable_logging
     from kimi_cli.metadata import load_metadata, save_metadata
     from kimi_cli.session import Session
+    from kimi_cli.utils.aiohttp import close_shared_client_session
     from kimi_cli.utils.logging import logger
 
     enable_logging(debug)
@@ -312,25 +333,29 @@ def kimi(
             thinking=thinking_mode,
             agent_file=agent_file,
         )
-        match ui:
-            case "shell":
-                succeeded = await instance.run_shell(command)
-            case "print":
-                succeeded = await instance.run_print(
-                    input_format or "text",
-                    output_format or "text",
-                    command,
-                )
-            case "acp":
-                if command is not None:
-                    logger.warning("ACP server ignores command argument")
-                await instance.run_acp()
-                succeeded = True
-            case "wire":
-                if command is not None:
-                    logger.warning("Wire server ignores command argument")
-                await instance.run_wire_stdio()
-                succeeded = True
+        try:
+            match ui:
+                case "shell":
+                    succeeded = await instance.run_shell(command)
+                case "print":
+                    succeeded = await instance.run_print(
+                        input_format or "text",
+                        output_format or "text",
+                        command,
+                    )
+                case "acp":
+                    if command is not None:
+                        logger.warning("ACP server ignores command argument")
+                    await instance.run_acp()
+                    succeeded = True
+                case "wire":
+                    if command is not None:
+                        logger.warning("Wire server ignores command argument")
+                    await instance.run_wire_stdio()
+                    succeeded = True
+        finally:
+            # connections pooled by the web tools belong to the event loop that is about to end
+            await close_shared_client_session()
 
         if succeeded:
             metadata = load_metadata()
@@ -354,9 +379,11 @@ def kimi(
 
         return succeeded
 
+    # only the interactive shell opts in, the other UIs keep the loop they are tested with
+    loop_factory = _shell_loop_factory() if ui == "shell" else None
     while True:
         try:
-            succeeded = asyncio.run(_run())
+            succeeded = asyncio.run(_run(), loop_factory=loop_factory)
             if succeeded:
                 break
             raise typer.Exit(code=1)
@@ -53,6 +53,17 @@ async def load_agents_md(work_dir: KaosPath) -> str | None:
     return None
 
 
+_environment: Environment | None = None
+
+
+async def _detect_environment() -> Environment:
+    """Detect the environment once per process, as it does not change between sessions."""
+    global _environment
+    if _environment is None:
+        _environment = await Environment.detect()
+    return _environment
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class Runtime:
     """Agent runtime."""
@@ -76,7 +87,7 @@ class Runtime:
         ls_output, agents_md, environment = await asyncio.gather(
             list_directory(session.work_dir),
             load_agents_md(session.work_dir),
-            Environment.detect(),
+            _detect_environment(),
         )
 
         return Runtime(
@@ -138,16 +149,32 @@ class LaborMarket:
         self.fixed_subagents: dict[str, Agent] = {}
         self.fixed_subagent_descs: dict[str, str] = {}
         self.dynamic_subagents: dict[str, Agent] = {}
+        self._fixed_subagents_md: str | None = None
 
     @property
     def subagents(self) -> Mapping[str, Agent]:
         """Get all subagents in the labor market."""
         return {**self.fixed_subagents, **self.dynamic_subagents}
 
+    def get_subagent(self, name: str) -> Agent | None:
+        """Get a subagent by name, without building the merged `subagents` mapping."""
+        agent = self.dynamic_subagents.get(name)
+        return agent if agent is not None else self.fixed_subagents.get(name)
+
+    @property
+    def fixed_subagents_md(self) -> str:
+        """Markdown list of the fixed subagents and their descriptions."""
+        if self._fixed_subagents_md is None:
+            self._fixed_subagents_md = "\n".join(
+                f"- `{name}`: {desc}" for name, desc in self.fixed_subagent_descs.items()
+            )
+        return self._fixed_subagents_md
+
     def add_fixed_subagent(self, name: str, agent: Agent, description: str):
         """Add a fixed subagent."""
         self.fixed_subagents[name] = agent
         self.fixed_subagent_descs[name] = description
+        self._fixed_subagents_md = None
 
     def add_dynamic_subagent(self, name: str, agent: Agent):
         """Add a dynamic subagent."""
@@ -82,21 +82,20 @@ class SimpleCompaction:
         if not messages or self.max_preserved_messages <= 0:
             return self.PrepareResult(compact_message=None, to_preserve=messages)
 
-        history = list(messages)
-        preserve_start_index = len(history)
+        preserve_start_index = len(messages)
         n_preserved = 0
-        for index in range(len(history) - 1, -1, -1):
-            if history[index].role in {"user", "assistant"}:
+        for offset, msg in enumerate(reversed(messages), start=1):
+            if msg.role in {"user", "assistant"}:
                 n_preserved += 1
                 if n_preserved == self.max_preserved_messages:
-                    preserve_start_index = index
+                    preserve_start_index = len(messages) - offset
                     break
 
         if n_preserved < self.max_preserved_messages:
             return self.PrepareResult(compact_message=None, to_preserve=messages)
 
-        to_compact = history[:preserve_start_index]
-        to_preserve = history[preserve_start_index:]
+        to_compact = messages[:preserve_start_index]
+        to_preserve = messages[preserve_start_index:]
 
         if not to_compact:
             # Let's hope this won't exceed the context size limit
@@ -13,6 +13,14 @@ from kimi_cli.utils.logging import logger
 from kimi_cli.utils.path import next_available_rotation
 
 
+def _checkpoint_line(checkpoint_id: int) -> str:
+    return json.dumps({"role": "_checkpoint", "id": checkpoint_id}) + "\n"
+
+
+def _usage_line(token_count: int) -> str:
+    return json.dumps({"role": "_usage", "token_count": token_count}) + "\n"
+
+
 class Context:
     def __init__(self, file_backend: Path):
         self._file_backend = file_backend
@@ -70,12 +78,15 @@ class Context:
         self._next_checkpoint_id += 1
         logger.debug("Checkpointing, ID: {id}", id=checkpoint_id)
 
-        async with aiofiles.open(self._file_backend, "a", encoding="utf-8") as f:
-            await f.write(json.dumps({"role": "_checkpoint", "id": checkpoint_id}) + "\n")
+        lines = _checkpoint_line(checkpoint_id)
         if add_user_message:
-            await self.append_message(
-                Message(role="user", content=[system(f"CHECKPOINT {checkpoint_id}")])
-            )
+            message = Message(role="user", content=[system(f"CHECKPOINT {checkpoint_id}")])
+            self._history.append(message)
+            lines += message.model_dump_json(exclude_none=True) + "\n"
+
+        # write the checkpoint and its user message together
+        async with aiofiles.open(self._file_backend, "a", encoding="utf-8") as f:
+            await f.write(lines)
 
     async def revert_to(self, checkpoint_id: int):
         """
@@ -110,26 +121,32 @@ class Context:
         self._history.clear()
         self._token_count = 0
         self._next_checkpoint_id = 0
-        async with (
-            aiofiles.open(rotated_file_path, encoding="utf-8") as old_file,
-            aiofiles.open(self._file_backend, "w", encoding="utf-8") as new_file,
-        ):
-            async for line in old_file:
-                if not line.strip():
-                    continue
-
-                line_json = json.loads(line)
-                if line_json["role"] == "_checkpoint" and line_json["id"] == checkpoint_id:
-                    break
-
-                await new_file.write(line)
-                if line_json["role"] == "_usage":
-                    self._token_count = line_json["token_count"]
-                elif line_json["role"] == "_checkpoint":
-                    self._next_checkpoint_id = line_json["id"] + 1
-                else:
-                    message = Message.model_validate(line_json)
-                    self._history.append(message)
+        async with aiofiles.open(rotated_file_path, "rb") as old_file:
+            content = await old_file.read()
+
+        # the checkpoint line is written verbatim by `checkpoint()`, and any occurrence inside a
+        # message would have its quotes escaped, so a byte search locates the line exactly
+        marker = _checkpoint_line(checkpoint_id).encode("utf-8")
+        if content.startswith(marker):
+            offset = 0
+        else:
+            offset = content.find(b"\n" + marker)
+            offset = len(content) if offset == -1 else offset + 1
+        prefix = content[:offset]
+
+        async with aiofiles.open(self._file_backend, "wb") as new_file:
+            await new_file.write(prefix)
+
+        for line in prefix.splitlines():
+            if not line.strip():
+                continue
+            line_json = json.loads(line)
+            if line_json["role"] == "_usage":
+                self._token_count = line_json["token_count"]
+            elif line_json["role"] == "_checkpoint":
+                self._next_checkpoint_id = line_json["id"] + 1
+            else:
+                self._history.append(Message.model_validate(line_json))
 
     async def clear(self):
         """
@@ -158,18 +175,36 @@ class Context:
         self._token_count = 0
         self._next_checkpoint_id = 0
 
-    async def append_message(self, message: Message | Sequence[Message]):
+    async def append_message(
+        self, message: Message | Sequence[Message], *, token_count: int | None = None
+    ):
+        """
+        Append message(s) to the context.
+
+        Args:
+            message (Message | Sequence[Message]): The message(s) to append.
+            token_count (int | None): If given, also update the token count after appending,
+                persisting both with a single write.
+        """
         logger.debug("Appending message(s) to context: {message}", message=message)
         messages = message if isinstance(message, Sequence) else [message]
         self._history.extend(messages)
 
+        lines = [message.model_dump_json(exclude_none=True) + "\n" for message in messages]
+        if token_count is not None and token_count != self._token_count:
+            logger.debug("Updating token count in context: {token_count}", token_count=token_count)
+            self._token_count = token_count
+            lines.append(_usage_line(token_count))
+
         async with aiofiles.open(self._file_backend, "a", encoding="utf-8") as f:
-            for message in messages:
-                await f.write(message.model_dump_json(exclude_none=True) + "\n")
+            await f.write("".join(lines))
 
     async def update_token_count(self, token_count: int):
+        if token_count == self._token_count:
+            # the last recorded usage already holds this value, no need to persist it again
+            return
         logger.debug("Updating token count in context: {token_count}", token_count=token_count)
         self._token_count = token_count
 
         async with aiofiles.open(self._file_backend, "a", encoding="utf-8") as f:
-            await f.write(json.dumps({"role": "_usage", "token_count": token_count}) + "\n")
+            await f.write(_usage_line(token_count))
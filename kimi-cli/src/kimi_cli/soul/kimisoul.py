@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Sequence
-from contextlib import suppress
 from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -15,6 +14,7 @@ from kosong.chat_provider import (
     APIEmptyResponseError,
     APIStatusError,
     APITimeoutError,
+    ChatProvider,
     ThinkingEffort,
 )
 from kosong.message import ContentPart, Message
@@ -34,6 +34,7 @@ from kimi_cli.soul.agent import Agent, Runtime
 from kimi_cli.soul.compaction import SimpleCompaction
 from kimi_cli.soul.context import Context
 from kimi_cli.soul.message import check_message, system, tool_result_to_message
+from kimi_cli.soul.toolset import KimiToolset
 from kimi_cli.tools.dmail import NAME as SendDMail_NAME
 from kimi_cli.tools.utils import ToolRejectedError
 from kimi_cli.utils.logging import logger
@@ -56,6 +57,18 @@ if TYPE_CHECKING:
 
 RESERVED_TOKENS = 50_000
 
+_RETRY_WAIT = wait_exponential_jitter(initial=0.3, max=5, jitter=0.5)
+"""Backoff between retries of steps and compaction; stateless, so shared by all souls."""
+
+_DMAIL_PROMPT_PREFIX = (
+    "You just got a D-Mail from your future self. "
+    "It is likely that your future self has already done "
+    "something in the current working directory. Please read "
+    "the D-Mail and decide what to do next. You MUST NEVER "
+    "mention to the user about this information. "
+    "D-Mail content:\n\n"
+)
+
 
 class KimiSoul:
     """The soul of Kimi CLI."""
@@ -84,13 +97,19 @@ class KimiSoul:
         if self._runtime.llm is not None:
             assert self._reserved_tokens <= self._runtime.llm.max_context_size
         self._thinking_effort: ThinkingEffort = "off"
-
-        for tool in agent.toolset.tools:
-            if tool.name == SendDMail_NAME:
-                self._checkpoint_with_user_message = True
-                break
+        self._thinking_chat_provider: ChatProvider | None = None
+        """The chat provider configured with `_thinking_effort`, created on first use."""
+        self._context_usage_cache: tuple[int, float] = (0, 0.0)
+        """The token count the context usage was last computed for, and that usage."""
+        self._step_retrying = self._build_retrying("step")
+        self._compaction_retrying = self._build_retrying("compaction")
+
+        if isinstance(agent.toolset, KimiToolset):
+            self._checkpoint_with_user_message = agent.toolset.has(SendDMail_NAME)
         else:
-            self._checkpoint_with_user_message = False
+            self._checkpoint_with_user_message = any(
+                tool.name == SendDMail_NAME for tool in agent.toolset.tools
+            )
 
     @property
     def name(self) -> str:
@@ -120,9 +139,15 @@ class KimiSoul:
 
     @property
     def _context_usage(self) -> float:
-        if self._runtime.llm is not None:
-            return self._context.token_count / self._runtime.llm.max_context_size
-        return 0.0
+        if self._runtime.llm is None:
+            return 0.0
+        token_count = self._context.token_count
+        if self._context_usage_cache[0] != token_count:
+            self._context_usage_cache = (
+                token_count,
+                token_count / self._runtime.llm.max_context_size,
+            )
+        return self._context_usage_cache[1]
 
     @property
     def wire_file_backend(self) -> Path:
@@ -146,6 +171,7 @@ class KimiSoul:
         if enabled and "thinking" not in self._runtime.llm.capabilities:
             raise LLMNotSupported(self._runtime.llm, ["thinking"])
         self._thinking_effort = "high" if enabled else "off"
+        self._thinking_chat_provider = None
 
     async def _checkpoint(self):
         await self._context.checkpoint(self._checkpoint_with_user_message)
@@ -226,11 +252,10 @@ class KimiSoul:
                 raise
             finally:
                 approval_task.cancel()  # stop piping approval requests to the wire
-                with suppress(asyncio.CancelledError):
-                    try:
-                        await approval_task
-                    except Exception:
-                        logger.exception("Approval piping task failed")
+                (approval_result,) = await asyncio.gather(approval_task, return_exceptions=True)
+                # a `CancelledError` is the expected outcome and not an `Exception`
+                if isinstance(approval_result, Exception):
+                    logger.opt(exception=approval_result).error("Approval piping task failed")
 
             if finished:
                 return
@@ -244,27 +269,21 @@ class KimiSoul:
         """Run an single step and return whether the run should be stopped."""
         # already checked in `run`
         assert self._runtime.llm is not None
-        chat_provider = self._runtime.llm.chat_provider
-
-        @tenacity.retry(
-            retry=retry_if_exception(self._is_retryable_error),
-            before_sleep=partial(self._retry_log, "step"),
-            wait=wait_exponential_jitter(initial=0.3, max=5, jitter=0.5),
-            stop=stop_after_attempt(self._loop_control.max_retries_per_step),
-            reraise=True,
-        )
-        async def _kosong_step_with_retry() -> StepResult:
-            # run an LLM step (may be interrupted)
-            return await kosong.step(
-                chat_provider.with_thinking(self._thinking_effort),
-                self._agent.system_prompt,
-                self._agent.toolset,
-                self._context.history,
-                on_message_part=wire_send,
-                on_tool_result=wire_send,
+        if self._thinking_chat_provider is None:
+            self._thinking_chat_provider = self._runtime.llm.chat_provider.with_thinking(
+                self._thinking_effort
             )
 
-        result = await _kosong_step_with_retry()
+        # run an LLM step (may be interrupted)
+        result: StepResult = await self._step_retrying(
+            kosong.step,
+            self._thinking_chat_provider,
+            self._agent.system_prompt,
+            self._agent.toolset,
+            self._context.history,
+            on_message_part=wire_send,
+            on_tool_result=wire_send,
+        )
         logger.debug("Got step result: {result}", result=result)
         if result.usage is not None:
             # mark the token count for the context before the step
@@ -295,16 +314,7 @@ class KimiSoul:
                 [
                     Message(
                         role="user",
-                        content=[
-                            system(
-                                "You just got a D-Mail from your future self. "
-                                "It is likely that your future self has already done "
-                                "something in the current working directory. Please read "
-                                "the D-Mail and decide what to do next. You MUST NEVER "
-                                "mention to the user about this information. "
-                                f"D-Mail content:\n\n{dmail.message.strip()}"
-                            )
-                        ],
+                        content=[system(_DMAIL_PROMPT_PREFIX + dmail.message.strip())],
                     )
                 ],
             )
@@ -314,25 +324,20 @@ class KimiSoul:
     async def _grow_context(self, result: StepResult, tool_results: list[ToolResult]):
         logger.debug("Growing context with result: {result}", result=result)
 
-        assert self._runtime.llm is not None
+        # `tool_result_to_message` flattens every part into a single `TextPart` while converting,
+        # so tool messages never require extra model capabilities and need no second pass of
+        # `check_message` here
         tool_messages = [tool_result_to_message(tr) for tr in tool_results]
-        for tm in tool_messages:
-            if missing_caps := check_message(tm, self._runtime.llm.capabilities):
-                logger.warning(
-                    "Tool result message requires unsupported capabilities: {caps}",
-                    caps=missing_caps,
-                )
-                raise LLMNotSupported(self._runtime.llm, list(missing_caps))
-
-        await self._context.append_message(result.message)
-        if result.usage is not None:
-            await self._context.update_token_count(result.usage.total)
 
         logger.debug(
             "Appending tool messages to context: {tool_messages}", tool_messages=tool_messages
         )
-        await self._context.append_message(tool_messages)
-        # token count of tool results are not available yet
+        # token count of tool results are not available yet, so the recorded count is the
+        # total usage up to and including the assistant message
+        await self._context.append_message(
+            [result.message, *tool_messages],
+            token_count=result.usage.total if result.usage is not None else None,
+        )
 
     async def compact_context(self) -> None:
         """
@@ -342,24 +347,27 @@ class KimiSoul:
             LLMNotSet: When the LLM is not set.
             ChatProviderError: When the chat provider returns an error.
         """
+        if self._runtime.llm is None:
+            raise LLMNotSet()
 
-        @tenacity.retry(
-            retry=retry_if_exception(self._is_retryable_error),
-            before_sleep=partial(self._retry_log, "compaction"),
-            wait=wait_exponential_jitter(initial=0.3, max=5, jitter=0.5),
-            stop=stop_after_attempt(self._loop_control.max_retries_per_step),
-            reraise=True,
+        compacted_messages: Sequence[Message] = await self._compaction_retrying(
+            self._compaction.compact, self._context.history, self._runtime.llm
         )
-        async def _compact_with_retry() -> Sequence[Message]:
-            if self._runtime.llm is None:
-                raise LLMNotSet()
-            return await self._compaction.compact(self._context.history, self._runtime.llm)
-
-        compacted_messages = await _compact_with_retry()
         await self._context.clear()
         await self._checkpoint()
         await self._context.append_message(compacted_messages)
 
+    def _build_retrying(self, name: str) -> tenacity.AsyncRetrying:
+        # `AsyncRetrying` keeps per-attempt state on itself, which is fine because a soul never
+        # runs two steps or two compactions concurrently
+        return tenacity.AsyncRetrying(
+            retry=retry_if_exception(self._is_retryable_error),
+            before_sleep=partial(self._retry_log, name),
+            wait=_RETRY_WAIT,
+            stop=stop_after_attempt(self._loop_control.max_retries_per_step),
+            reraise=True,
+        )
+
     @staticmethod
     def _is_retryable_error(exception: BaseException) -> bool:
         if isinstance(exception, (APIConnectionError, APITimeoutError, APIEmptyResponseError)):
@@ -6,7 +6,7 @@ from kosong.message import ContentPart, ImageURLPart, Message, TextPart, ThinkPa
 from kosong.tooling import ToolError, ToolResult
 from kosong.tooling.error import ToolRuntimeError
 
-from kimi_cli.llm import ModelCapability
+from kimi_cli.llm import ALL_MODEL_CAPABILITIES, ModelCapability
 
 
 def system(message: str) -> ContentPart:
@@ -64,10 +64,19 @@ def _flatten_content_to_single_text(parts: list[ContentPart]) -> list[ContentPar
     """Ensure tool message content is a single TextPart (string)."""
     if not parts:
         return [TextPart(text="")]
+    if len(parts) == 1 and isinstance(parts[0], TextPart):
+        # the common case of a single text output, already in the expected shape
+        return parts
     texts: list[str] = []
     for part in parts:
         if isinstance(part, TextPart):
             texts.append(part.text)
+        elif isinstance(part, ThinkPart):
+            texts.append(part.think)
+        elif isinstance(part, ImageURLPart):
+            url = part.image_url.url
+            # inline base64 data is meaningless as text and would only waste tokens
+            texts.append("[image]" if url.startswith("data:") else f"[image: {url}]")
         else:
             # Fallback: stringify non-text parts to keep info without breaking API
             texts.append(part.model_dump_json())
@@ -78,6 +87,9 @@ def check_message(
     message: Message, model_capabilities: set[ModelCapability]
 ) -> set[ModelCapability]:
     """Check the message content, return the missing model capabilities."""
+    if model_capabilities >= ALL_MODEL_CAPABILITIES:
+        # nothing can be missing, no need to look at the content
+        return set()
     capabilities_needed = set[ModelCapability]()
     for part in message.content:
         if isinstance(part, ImageURLPart):
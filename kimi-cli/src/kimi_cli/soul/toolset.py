@@ -24,9 +24,15 @@ type ToolType = CallableTool | CallableTool2[Any]
 class KimiToolset:
     def __init__(self) -> None:
         self._inner = SimpleToolset()
+        self._name_index: dict[str, ToolType] = {}
 
     def add(self, tool: ToolType) -> None:
         self._inner += tool
+        self._name_index[tool.name] = tool
+
+    def has(self, name: str) -> bool:
+        """Whether a tool with the given name has been added."""
+        return name in self._name_index
 
     @property
     def tools(self) -> list[Tool]:
@@ -1,4 +1,6 @@
 import json
+import re
+import weakref
 from typing import cast
 
 import streamingjson  # pyright: ignore[reportMissingTypeStubs]
@@ -14,80 +16,117 @@ class SkipThisTool(Exception):
     pass
 
 
+_KEY_ARGUMENTS: dict[str, str | None] = {
+    "Task": "description",
+    "CreateSubagent": "name",
+    "SendDMail": None,
+    "Think": "thought",
+    "SetTodoList": None,
+    "Shell": "command",
+    "ReadFile": "path",
+    "Glob": "pattern",
+    "Grep": "pattern",
+    "WriteFile": "path",
+    "StrReplaceFile": "path",
+    "SearchWeb": "query",
+    "FetchURL": "url",
+}
+"""The argument to display for each builtin tool, or `None` if nothing should be displayed."""
+
+_PATH_TOOLS = frozenset({"ReadFile", "WriteFile", "StrReplaceFile"})
+"""Builtin tools whose key argument is a path to be shown relative to the working directory."""
+
+
 def extract_key_argument(json_content: str | streamingjson.Lexer, tool_name: str) -> str | None:
     if isinstance(json_content, streamingjson.Lexer):
-        json_str = json_content.complete_json()
+        # lexer.json_content is list[str] based on streamingjson source code
+        content: list[str] = cast(list[str], json_content.json_content)  # pyright: ignore[reportUnknownMemberType]
+        raw_json = "".join(content)
     else:
-        json_str = json_content
-    try:
-        curr_args: JsonType = json.loads(json_str)
-    except json.JSONDecodeError:
-        return None
-    if not curr_args:
-        return None
-    key_argument: str = ""
-    match tool_name:
-        case "Task":
-            if not isinstance(curr_args, dict) or not curr_args.get("description"):
-                return None
-            key_argument = str(curr_args["description"])
-        case "CreateSubagent":
-            if not isinstance(curr_args, dict) or not curr_args.get("name"):
-                return None
-            key_argument = str(curr_args["name"])
-        case "SendDMail":
+        raw_json = json_content
+
+    if tool_name in _KEY_ARGUMENTS:
+        key = _KEY_ARGUMENTS[tool_name]
+        if key is None:
             return None
-        case "Think":
-            if not isinstance(curr_args, dict) or not curr_args.get("thought"):
+        key_argument = _scan_closed_string_argument(raw_json, key)
+        if key_argument is None:
+            # the value is still streaming (or not a plain string), parse the completed JSON
+            curr_args = _parse_arguments(json_content, raw_json)
+            if not isinstance(curr_args, dict) or not curr_args.get(key):
                 return None
-            key_argument = str(curr_args["thought"])
-        case "SetTodoList":
+            key_argument = str(curr_args[key])
+        if tool_name in _PATH_TOOLS:
+            key_argument = _normalize_path(key_argument)
+    else:
+        if not _parse_arguments(json_content, raw_json):
             return None
-        case "Shell":
-            if not isinstance(curr_args, dict) or not curr_args.get("command"):
-                return None
-            key_argument = str(curr_args["command"])
-        case "ReadFile":
-            if not isinstance(curr_args, dict) or not curr_args.get("path"):
-                return None
-            key_argument = _normalize_path(str(curr_args["path"]))
-        case "Glob":
-            if not isinstance(curr_args, dict) or not curr_args.get("pattern"):
-                return None
-            key_argument = str(curr_args["pattern"])
-        case "Grep":
-            if not isinstance(curr_args, dict) or not curr_args.get("pattern"):
-                return None
-            key_argument = str(curr_args["pattern"])
-        case "WriteFile":
-            if not isinstance(curr_args, dict) or not curr_args.get("path"):
-                return None
-            key_argument = _normalize_path(str(curr_args["path"]))
-        case "StrReplaceFile":
-            if not isinstance(curr_args, dict) or not curr_args.get("path"):
-                return None
-            key_argument = _normalize_path(str(curr_args["path"]))
-        case "SearchWeb":
-            if not isinstance(curr_args, dict) or not curr_args.get("query"):
-                return None
-            key_argument = str(curr_args["query"])
-        case "FetchURL":
-            if not isinstance(curr_args, dict) or not curr_args.get("url"):
-                return None
-            key_argument = str(curr_args["url"])
-        case _:
-            if isinstance(json_content, streamingjson.Lexer):
-                # lexer.json_content is list[str] based on streamingjson source code
-                content: list[str] = cast(list[str], json_content.json_content)  # pyright: ignore[reportUnknownMemberType]
-                key_argument = "".join(content)
-            else:
-                key_argument = json_content
+        key_argument = raw_json
     key_argument = shorten_middle(key_argument, width=50)
     return key_argument
 
 
+_parsed_arguments: weakref.WeakKeyDictionary[streamingjson.Lexer, tuple[int, JsonType]] = (
+    weakref.WeakKeyDictionary()
+)
+"""The length of the raw JSON each lexer had when it was last parsed, with the parsed result."""
+
+
+def _parse_arguments(json_content: str | streamingjson.Lexer, raw_json: str) -> JsonType:
+    if not isinstance(json_content, streamingjson.Lexer):
+        return _load_arguments(json_content)
+    # a lexer only ever grows, so the same length means nothing was appended since the last
+    # parse, e.g. when a tool call is re-rendered, and the completed JSON is the same
+    parsed = _parsed_arguments.get(json_content)
+    if parsed is not None and parsed[0] == len(raw_json):
+        return parsed[1]
+    curr_args = _load_arguments(json_content.complete_json())
+    _parsed_arguments[json_content] = (len(raw_json), curr_args)
+    return curr_args
+
+
+_STRING_ARGUMENT_PATTERNS = {
+    key: re.compile(rf'"{key}"\s*:\s*"((?:[^"\\]|\\.)*)"')
+    for key in _KEY_ARGUMENTS.values()
+    if key is not None
+}
+
+
+def _scan_closed_string_argument(raw_json: str, key: str) -> str | None:
+    """
+    Find the value of `key` in (possibly incomplete) raw JSON without parsing all of it.
+    Return `None` if the value is not a closed, non-empty string yet.
+    """
+    match = _STRING_ARGUMENT_PATTERNS[key].search(raw_json)
+    if match is None or not match.group(1):
+        return None
+    try:
+        return json.loads(f'"{match.group(1)}"')
+    except json.JSONDecodeError:
+        return None
+
+
+def _load_arguments(json_str: str) -> JsonType:
+    try:
+        return json.loads(json_str)
+    except json.JSONDecodeError:
+        return None
+
+
+_canonical_cwd_cache: tuple[str, str] | None = None
+"""The last seen working directory and its canonical form."""
+
+
+def _canonical_cwd() -> str:
+    global _canonical_cwd_cache
+    cwd = str(KaosPath.cwd())
+    if _canonical_cwd_cache is None or _canonical_cwd_cache[0] != cwd:
+        _canonical_cwd_cache = (cwd, str(KaosPath(cwd).canonical()))
+    return _canonical_cwd_cache[1]
+
+
 def _normalize_path(path: str) -> str:
-    cwd = str(KaosPath.cwd().canonical())
+    cwd = _canonical_cwd()
     if path.startswith(cwd):
         path = path[len(cwd) :].lstrip("/\\")
     return path
@@ -4,14 +4,14 @@ from typing import override
 from kosong.tooling import CallableTool2, ToolError, ToolOk, ToolReturnValue
 
 from kimi_cli.soul.denwarenji import DenwaRenji, DenwaRenjiError, DMail
-from kimi_cli.tools.utils import load_desc
+from kimi_cli.tools.utils import lazy_desc
 
 NAME = "SendDMail"
 
 
 class SendDMail(CallableTool2[DMail]):
     name: str = NAME
-    description: str = load_desc(Path(__file__).parent / "dmail.md")
+    description: str = lazy_desc(Path(__file__).parent / "dmail.md")
     params: type[DMail] = DMail
 
     def __init__(self, denwa_renji: DenwaRenji) -> None:
@@ -1,4 +1,6 @@
+import importlib
 from enum import Enum
+from typing import TYPE_CHECKING, Any
 
 
 class FileOpsWindow:
@@ -12,11 +14,28 @@ class FileActions(str, Enum):
     EDIT = "edit file"
 
 
-from .glob import Glob  # noqa: E402
-from .grep_local import Grep  # noqa: E402
-from .read import ReadFile  # noqa: E402
-from .replace import StrReplaceFile  # noqa: E402
-from .write import WriteFile  # noqa: E402
+if TYPE_CHECKING:
+    from .glob import Glob
+    from .grep_local import Grep
+    from .read import ReadFile
+    from .replace import StrReplaceFile
+    from .write import WriteFile
+
+# tool modules pull in heavy dependencies (e.g. ripgrep), so they are imported on first access
+_TOOL_MODULES = {
+    "Glob": ".glob",
+    "Grep": ".grep_local",
+    "ReadFile": ".read",
+    "StrReplaceFile": ".replace",
+    "WriteFile": ".write",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if module_name := _TOOL_MODULES.get(name):
+        return getattr(importlib.import_module(module_name, __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = (
     "ReadFile",
@@ -1,19 +1,116 @@
 """Glob tool implementation."""
 
-from pathlib import Path
+import asyncio
+import contextlib
+import heapq
+import platform
+import re
+import stat
+from pathlib import Path, PurePosixPath
 from typing import override
 
+from kaos import get_current_kaos
+from kaos.local import local_kaos
 from kaos.path import KaosPath
 from kosong.tooling import CallableTool2, ToolError, ToolOk, ToolReturnValue
 from pydantic import BaseModel, Field
 
 from kimi_cli.soul.agent import BuiltinSystemPromptArgs
-from kimi_cli.tools.utils import load_desc
+from kimi_cli.tools.utils import lazy_desc
+from kimi_cli.utils.logging import logger
 from kimi_cli.utils.path import is_within_directory, list_directory
 
 MAX_MATCHES = 1000
 
 
+async def _only_files(paths: list[KaosPath]) -> list[KaosPath]:
+    is_file = await asyncio.gather(*(p.is_file() for p in paths))
+    return [p for p, keep in zip(paths, is_file, strict=True) if keep]
+
+
+_WILDCARD_ONLY_SEGMENT = re.compile(r"(?:[*?]|\[[^\]]*\])*")
+"""A pattern segment without any literal character, e.g. `*` or `?[ab]`."""
+
+
+def _is_unanchored_recursive(pattern: str) -> bool:
+    """Whether `pattern` reaches a `**` segment before any literal path segment, e.g. `*/**/x`."""
+    for segment in pattern.replace("\\", "/").split("/"):
+        if segment == "**":
+            return True
+        if not _WILDCARD_ONLY_SEGMENT.fullmatch(segment):
+            return False
+    return False
+
+
+def _relative_paths(paths: list[KaosPath], base: KaosPath) -> list[str]:
+    """Paths under `base` relative to it, by slicing off the common string prefix."""
+    # joining a dummy name gives the prefix with the right separator, even for a root `base`
+    prefix = str(base / "_")[:-1]
+    return [
+        s[len(prefix) :] if (s := str(p)).startswith(prefix) else str(p.relative_to(base))
+        for p in paths
+    ]
+
+
+def _can_glob_with_rg(pattern: str) -> bool:
+    """Whether ripgrep can list the files matching `pattern` the same way `KaosPath.glob` would."""
+    if get_current_kaos().name != local_kaos.name:
+        return False
+    # ripgrep's globs expand `{a,b}` and read `[!x]` / `[^x]` classes differently from pathlib
+    if "{" in pattern or "[" in pattern:
+        return False
+    parts = PurePosixPath(pattern.replace("\\", "/")).parts
+    return bool(parts) and not pattern.startswith(("/", "\\")) and ".." not in parts
+
+
+async def _rg_glob_files(dir_path: KaosPath, pattern: str, limit: int) -> list[KaosPath] | None:
+    """
+    List the files under `dir_path` matching `pattern` with ripgrep, which walks directories in
+    parallel. At most `limit` files are returned. Returns `None` if ripgrep is not installed,
+    which is never downloaded just for a glob.
+    """
+    # the Grep module is only loaded when ripgrep is actually used
+    from kimi_cli.tools.file.grep_local import find_rg_path, forget_rg_path
+
+    rg_path = find_rg_path()
+    if rg_path is None:
+        return None
+
+    # the leading `/` anchors the glob at the search root, like a pathlib glob; hidden and
+    # ignored files are listed too, and `--follow` lists symlinked files like pathlib does,
+    # but unlike pathlib's `**` it also descends into symlinked directories
+    args = ["--files", "--no-config", "--hidden", "--no-ignore", "--no-messages", "--follow"]
+    args += ["--glob", f"/{pattern}"]
+    if platform.system() == "Windows":
+        args.append("--glob-case-insensitive")
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            rg_path,
+            *args,
+            cwd=str(dir_path),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        forget_rg_path()
+        raise
+    assert process.stdout is not None
+
+    files: list[KaosPath] = []
+    try:
+        async for line in process.stdout:
+            files.append(dir_path / line.decode("utf-8", errors="replace").rstrip("\r\n"))
+            if len(files) >= limit:
+                break
+    finally:
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+    return files
+
+
 class Params(BaseModel):
     pattern: str = Field(description=("Glob pattern to match files/directories."))
     directory: str | None = Field(
@@ -30,7 +127,7 @@ class Params(BaseModel):
 
 class Glob(CallableTool2[Params]):
     name: str = "Glob"
-    description: str = load_desc(
+    description: str = lazy_desc(
         Path(__file__).parent / "glob.md",
         {
             "MAX_MATCHES": str(MAX_MATCHES),
@@ -45,19 +142,23 @@ class Glob(CallableTool2[Params]):
     async def _validate_pattern(self, pattern: str) -> ToolError | None:
         """Validate that the pattern is safe to use."""
         if pattern.startswith("**"):
-            ls_result = await list_directory(self._work_dir)
-            return ToolError(
-                output=ls_result,
-                message=(
-                    f"Pattern `{pattern}` starts with '**' which is not allowed. "
-                    "This would recursively search all directories and may include large "
-                    "directories like `node_modules`. Use more specific patterns instead. "
-                    "For your convenience, a list of all files and directories in the "
-                    "top level of the working directory is provided below."
-                ),
-                brief="Unsafe pattern",
-            )
-        return None
+            reason = "starts with '**' which is not allowed"
+        elif _is_unanchored_recursive(pattern):
+            reason = "only has wildcards before '**' which is not allowed"
+        else:
+            return None
+        ls_result = await list_directory(self._work_dir)
+        return ToolError(
+            output=ls_result,
+            message=(
+                f"Pattern `{pattern}` {reason}. "
+                "This would recursively search all directories and may include large "
+                "directories like `node_modules`. Use more specific patterns instead. "
+                "For your convenience, a list of all files and directories in the "
+                "top level of the working directory is provided below."
+            ),
+            brief="Unsafe pattern",
+        )
 
     async def _validate_directory(self, directory: KaosPath) -> ToolError | None:
         """Validate that the directory is safe to search."""
@@ -98,44 +199,68 @@ class Glob(CallableTool2[Params]):
             if dir_error:
                 return dir_error
 
-            if not await dir_path.exists():
+            try:
+                dir_mode = (await dir_path.stat()).st_mode
+            except (FileNotFoundError, NotADirectoryError):
                 return ToolError(
                     message=f"`{params.directory}` does not exist.",
                     brief="Directory not found",
                 )
-            if not await dir_path.is_dir():
+            if not stat.S_ISDIR(dir_mode):
                 return ToolError(
                     message=f"`{params.directory}` is not a directory.",
                     brief="Invalid directory",
                 )
 
-            # Perform the glob search - users can use ** directly in pattern
-            matches: list[KaosPath] = []
-            async for match in dir_path.glob(params.pattern):
-                matches.append(match)
+            # Perform the glob search - users can use ** directly in pattern.
+            # Stop walking as soon as there are more matches than can be returned.
+            matches: list[KaosPath] | None = None
+            if not params.include_dirs and _can_glob_with_rg(params.pattern):
+                # ripgrep only lists files, which is exactly what is asked for here
+                try:
+                    matches = await _rg_glob_files(dir_path, params.pattern, MAX_MATCHES + 1)
+                except Exception as e:
+                    logger.warning("Failed to glob with ripgrep, falling back: {error}", error=e)
 
-            # Filter out directories if not requested
-            if not params.include_dirs:
-                matches = [p for p in matches if await p.is_file()]
+            if matches is not None:
+                truncated = len(matches) > MAX_MATCHES
+            else:
+                matches = []
+                n_checked = 0
+                truncated = False
+                async for match in dir_path.glob(params.pattern):
+                    matches.append(match)
+                    if len(matches) <= MAX_MATCHES:
+                        continue
+                    if not params.include_dirs:
+                        matches[n_checked:] = await _only_files(matches[n_checked:])
+                        n_checked = len(matches)
+                    if len(matches) > MAX_MATCHES:
+                        truncated = True
+                        break
 
-            # Sort for consistent output
-            matches.sort()
+                # Filter out directories if not requested
+                if not params.include_dirs:
+                    matches[n_checked:] = await _only_files(matches[n_checked:])
 
-            # Limit matches
-            message = (
-                f"Found {len(matches)} matches for pattern `{params.pattern}`."
-                if len(matches) > 0
-                else f"No matches found for pattern `{params.pattern}`."
-            )
-            if len(matches) > MAX_MATCHES:
-                matches = matches[:MAX_MATCHES]
-                message += (
-                    f" Only the first {MAX_MATCHES} matches are returned. "
+            # Sort the matches found so far for consistent output, keeping no more than the limit;
+            # when the scan stopped early these are not the smallest of all matching paths
+            matches = heapq.nsmallest(MAX_MATCHES, matches)
+
+            if truncated:
+                message = (
+                    f"Found more than {MAX_MATCHES} matches for pattern `{params.pattern}`. "
+                    f"Only {MAX_MATCHES} of the matches are returned "
+                    "(not necessarily the first in sorted order). "
                     "You may want to use a more specific pattern."
                 )
+            elif matches:
+                message = f"Found {len(matches)} matches for pattern `{params.pattern}`."
+            else:
+                message = f"No matches found for pattern `{params.pattern}`."
 
             return ToolOk(
-                output="\n".join(str(p.relative_to(dir_path)) for p in matches),
+                output="\n".join(_relative_paths(matches, dir_path)),
                 message=message,
             )
 
@@ -4,23 +4,27 @@ Be cautious that `KaosPath` is not used in this implementation.
 """
 
 import asyncio
+import base64
+import contextlib
+import json
+import os
 import platform
 import shutil
 import stat
 import tarfile
 import tempfile
 import zipfile
+from collections.abc import AsyncIterator
 from pathlib import Path
-from typing import override
+from typing import Any, override
 
 import aiohttp
-import ripgrepy  # pyright: ignore[reportMissingTypeStubs]
 from kosong.tooling import CallableTool2, ToolError, ToolReturnValue
 from pydantic import BaseModel, Field
 
 import kimi_cli
 from kimi_cli.share import get_share_dir
-from kimi_cli.tools.utils import ToolResultBuilder, load_desc
+from kimi_cli.tools.utils import ToolResultBuilder, lazy_desc
 from kimi_cli.utils.aiohttp import new_client_session
 from kimi_cli.utils.logging import logger
 
@@ -185,12 +189,18 @@ async def _download_and_install_rg(bin_name: str) -> Path:
             try:
                 async with session.get(url) as resp:
                     resp.raise_for_status()
+                    n_bytes = 0
                     with open(tar_path, "wb") as fh:
-                        async for chunk in resp.content.iter_chunked(1024 * 64):
-                            if chunk:
-                                fh.write(chunk)
+                        # write whatever has arrived instead of re-chunking it into fixed sizes
+                        async for chunk in resp.content.iter_any():
+                            fh.write(chunk)
+                            n_bytes += len(chunk)
             except (aiohttp.ClientError, TimeoutError) as exc:
                 raise RuntimeError("Failed to download ripgrep binary") from exc
+            if resp.content_length is not None and n_bytes != resp.content_length:
+                raise RuntimeError(
+                    f"Incomplete ripgrep download: got {n_bytes} of {resp.content_length} bytes"
+                )
 
             try:
                 if is_windows:
@@ -224,7 +234,32 @@ async def _download_and_install_rg(bin_name: str) -> Path:
     return destination
 
 
-async def _ensure_rg_path() -> str:
+_rg_path: str | None = None
+"""The resolved ripgrep binary, cached after the first successful lookup."""
+
+
+async def ensure_rg_path() -> str:
+    global _rg_path
+    if _rg_path is None:
+        _rg_path = await _resolve_rg_path()
+    return _rg_path
+
+
+def find_rg_path() -> str | None:
+    """Look up an installed ripgrep binary like `ensure_rg_path`, but never download one."""
+    global _rg_path
+    if _rg_path is None and (existing := _find_existing_rg(_rg_binary_name())):
+        _rg_path = str(existing)
+    return _rg_path
+
+
+def forget_rg_path() -> None:
+    """Drop the cached ripgrep binary, e.g. when it no longer exists."""
+    global _rg_path
+    _rg_path = None
+
+
+async def _resolve_rg_path() -> str:
     bin_name = _rg_binary_name()
     existing = _find_existing_rg(bin_name)
     if existing:
@@ -239,9 +274,151 @@ async def _ensure_rg_path() -> str:
         return str(downloaded)
 
 
+def _build_rg_args(params: Params, *, single_file: bool) -> list[str]:
+    args: list[str] = []
+
+    # memory maps are faster for one large file, but slower for walking many small ones, which
+    # is best spread over all the cores this process may run on
+    if single_file:
+        args.append("--mmap")
+    elif n_cpus := os.process_cpu_count():
+        args += ["--threads", str(n_cpus)]
+
+    # Apply search options
+    if params.ignore_case:
+        args.append("--ignore-case")
+    if params.multiline:
+        args += ["--multiline", "--multiline-dotall"]
+
+    # Content display options (only for content mode)
+    if params.output_mode == "content":
+        if params.before_context is not None:
+            args += ["--before-context", str(params.before_context)]
+        if params.after_context is not None:
+            args += ["--after-context", str(params.after_context)]
+        if params.context is not None:
+            args += ["--context", str(params.context)]
+        if params.line_number:
+            args.append("--line-number")
+        if params.head_limit is not None:
+            # no file can contribute more than `head_limit` matching lines to the output, so let
+            # ripgrep stop searching a file early instead of discarding its matches afterwards
+            args += ["--max-count", str(params.head_limit)]
+        # matching and context lines are rendered by `_JsonOutputFormatter`
+        args.append("--json")
+
+    # File filtering options
+    if params.glob:
+        args += ["--glob", params.glob]
+    if params.type:
+        args += ["--type", params.type]
+
+    # Set output mode
+    if params.output_mode == "files_with_matches":
+        args.append("--files-with-matches")
+    elif params.output_mode == "count_matches":
+        args.append("--count-matches")
+
+    # `--` so that patterns starting with `-` are not taken as options
+    args += ["--", params.pattern, params.path]
+    return args
+
+
+_RG_STREAM_LIMIT = 1024 * 1024
+"""Maximum length of a single line of ripgrep output."""
+
+_RG_OVERFLOW_PLACEHOLDER = (
+    f"[a line of output longer than {_RG_STREAM_LIMIT // 1024 // 1024} MB was omitted]\n"
+)
+"""Shown in place of a line of ripgrep output that is longer than `_RG_STREAM_LIMIT`."""
+
+
+def _json_text(data: dict[str, Any]) -> str:
+    """Decode an arbitrary data object of ripgrep's JSON output."""
+    if "text" in data:
+        return data["text"]
+    return base64.b64decode(data["bytes"]).decode("utf-8", errors="replace")
+
+
+class _JsonOutputFormatter:
+    """
+    Render the `match` and `context` events of `rg --json` like ripgrep's standard output, i.e.
+    `path:line:text` for matching lines, `path-line-text` for context lines and `--` between
+    context groups.
+    """
+
+    def __init__(self, params: Params, *, single_file: bool) -> None:
+        # like ripgrep, only show file paths when not searching a single file
+        self._with_path = not single_file
+        self._line_number = params.line_number
+        self._with_separators = bool(
+            params.before_context or params.after_context or params.context
+        )
+        self._last_line: tuple[str, int] | None = None
+
+    def feed(self, event_line: bytes) -> list[str]:
+        try:
+            event = json.loads(event_line)
+        except ValueError:
+            # the tail of an event line that overflowed the stream limit, which
+            # `_iter_rg_output` has already reported
+            return []
+        if event.get("type") not in ("match", "context"):
+            return []
+
+        data = event["data"]
+        path = _json_text(data["path"])
+        line_no: int | None = data.get("line_number")
+        sep = ":" if event["type"] == "match" else "-"
+
+        rendered: list[str] = []
+        if (
+            self._with_separators
+            and line_no is not None
+            and self._last_line is not None
+            and self._last_line != (path, line_no - 1)
+        ):
+            rendered.append("--\n")
+        # a multiline match spans several lines
+        lines = _json_text(data["lines"]).removesuffix("\n").split("\n")
+        for i, text in enumerate(lines):
+            prefix = f"{path}{sep}" if self._with_path else ""
+            if self._line_number and line_no is not None:
+                prefix += f"{line_no + i}{sep}"
+            rendered.append(f"{prefix}{text}\n")
+        if line_no is not None:
+            self._last_line = (path, line_no + len(lines) - 1)
+        return rendered
+
+
+async def _iter_rg_output(
+    stdout: asyncio.StreamReader, formatter: _JsonOutputFormatter | None
+) -> AsyncIterator[str]:
+    """Iterate the lines of ripgrep's output as they are produced."""
+    overflowing = False
+    while True:
+        try:
+            line = await stdout.readline()
+        except ValueError:
+            # a line longer than the stream limit, only possible for a huge line in JSON mode;
+            # it may take several reads to skip it, but it is reported once
+            if not overflowing:
+                overflowing = True
+                yield _RG_OVERFLOW_PLACEHOLDER
+            continue
+        overflowing = False
+        if not line:
+            return
+        if formatter is None:
+            yield line.decode("utf-8", errors="replace")
+        else:
+            for rendered in formatter.feed(line):
+                yield rendered
+
+
 class Grep(CallableTool2[Params]):
     name: str = "Grep"
-    description: str = load_desc(Path(__file__).parent / "grep.md")
+    description: str = lazy_desc(Path(__file__).parent / "grep.md")
     params: type[Params] = Params
 
     @override
@@ -250,60 +427,64 @@ class Grep(CallableTool2[Params]):
             builder = ToolResultBuilder()
             message = ""
 
-            # Initialize ripgrep with pattern and path
-            rg_path = await _ensure_rg_path()
+            single_file = Path(params.path).is_file()
+            rg_path = await ensure_rg_path()
             logger.debug("Using ripgrep binary: {rg_bin}", rg_bin=rg_path)
-            rg = ripgrepy.Ripgrepy(params.pattern, params.path, rg_path=rg_path)
-
-            # Apply search options
-            if params.ignore_case:
-                rg = rg.ignore_case()
-            if params.multiline:
-                rg = rg.multiline().multiline_dotall()
-
-            # Content display options (only for content mode)
-            if params.output_mode == "content":
-                if params.before_context is not None:
-                    rg = rg.before_context(params.before_context)
-                if params.after_context is not None:
-                    rg = rg.after_context(params.after_context)
-                if params.context is not None:
-                    rg = rg.context(params.context)
-                if params.line_number:
-                    rg = rg.line_number()
-
-            # File filtering options
-            if params.glob:
-                rg = rg.glob(params.glob)
-            if params.type:
-                rg = rg.type_(params.type)
-
-            # Set output mode
-            if params.output_mode == "files_with_matches":
-                rg = rg.files_with_matches()
-            elif params.output_mode == "count_matches":
-                rg = rg.count_matches()
-
-            # Execute search
-            result = rg.run(universal_newlines=False)
-
-            # Get results
-            output = result.as_string
-
-            # Apply head limit if specified
-            if params.head_limit is not None:
-                lines = output.split("\n")
-                if len(lines) > params.head_limit:
-                    lines = lines[: params.head_limit]
-                    output = "\n".join(lines)
-                    message = f"Results truncated to first {params.head_limit} lines"
-                    if params.output_mode in ["content", "files_with_matches", "count_matches"]:
-                        output += f"\n... (results truncated to {params.head_limit} lines)"
-
-            if not output:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    rg_path,
+                    *_build_rg_args(params, single_file=single_file),
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    limit=_RG_STREAM_LIMIT,
+                )
+            except FileNotFoundError:
+                # the cached binary is gone, look it up again on the next call
+                forget_rg_path()
+                raise
+            assert process.stdout is not None and process.stderr is not None
+            stderr_task = asyncio.create_task(process.stderr.read())
+
+            # Consume the output as it is produced, and stop ripgrep as soon as no more of it
+            # can be used, instead of waiting for the whole search to finish
+            n_lines = 0
+            head_limit_reached = False
+            finished = False
+            try:
+                formatter = None
+                if params.output_mode == "content":
+                    formatter = _JsonOutputFormatter(params, single_file=single_file)
+                async for line in _iter_rg_output(process.stdout, formatter):
+                    if params.head_limit is not None and n_lines >= params.head_limit:
+                        head_limit_reached = True
+                        break
+                    builder.write(line)
+                    n_lines += 1
+                    if builder.is_full:
+                        break
+                else:
+                    finished = True
+            finally:
+                if not finished:
+                    with contextlib.suppress(ProcessLookupError):
+                        process.kill()
+                returncode = await process.wait()
+                stderr = (await stderr_task).decode("utf-8", errors="replace").strip()
+
+            if head_limit_reached:
+                message = f"Results truncated to first {params.head_limit} lines"
+                builder.write(f"... (results truncated to {params.head_limit} lines)")
+
+            if n_lines == 0 and not head_limit_reached:
+                # ripgrep exits with 1 for no matches and 2 for errors
+                if finished and returncode not in (0, 1):
+                    return ToolError(
+                        message=f"Failed to grep. Error: {stderr}",
+                        brief="Failed to grep",
+                    )
                 return builder.ok(message="No matches found")
 
-            builder.write(output)
             return builder.ok(message=message)
 
         except Exception as e:
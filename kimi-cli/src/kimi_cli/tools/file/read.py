@@ -1,3 +1,6 @@
+import io
+import itertools
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import override
 
@@ -6,11 +9,26 @@ from kosong.tooling import CallableTool2, ToolError, ToolOk, ToolReturnValue
 from pydantic import BaseModel, Field
 
 from kimi_cli.soul.agent import BuiltinSystemPromptArgs
-from kimi_cli.tools.utils import load_desc, truncate_line
+from kimi_cli.tools.utils import lazy_desc, regular_file_size, truncate_line
 
 MAX_LINES = 1000
 MAX_LINE_LENGTH = 2000
 MAX_BYTES = 100 << 10  # 100KB
+READ_AT_ONCE_MAX_SIZE = 4 << 20  # 4MB
+"""Files up to this size are read with a single call and split in memory."""
+_NUMBERED_LINE = "%6d\t%s"
+
+
+async def _iter_lines(p: KaosPath, file_size: int) -> AsyncIterator[str]:
+    """Iterate the lines of a file, avoiding a read per line for files of moderate size."""
+    if file_size > READ_AT_ONCE_MAX_SIZE:
+        async for line in p.read_lines(errors="replace"):
+            yield line
+        return
+    text = (await p.read_bytes()).decode("utf-8", errors="replace")
+    # universal newlines, same as reading the file in text mode
+    for line in io.StringIO(text, newline=None):
+        yield line
 
 
 class Params(BaseModel):
@@ -37,7 +55,7 @@ class Params(BaseModel):
 
 class ReadFile(CallableTool2[Params]):
     name: str = "ReadFile"
-    description: str = load_desc(
+    description: str = lazy_desc(
         Path(__file__).parent / "read.md",
         {
             "MAX_LINES": str(MAX_LINES),
@@ -68,16 +86,9 @@ class ReadFile(CallableTool2[Params]):
                     brief="Invalid path",
                 )
 
-            if not await p.exists():
-                return ToolError(
-                    message=f"`{params.path}` does not exist.",
-                    brief="File not found",
-                )
-            if not await p.is_file():
-                return ToolError(
-                    message=f"`{params.path}` is not a file.",
-                    brief="Invalid path",
-                )
+            file_size = await regular_file_size(p, params.path)
+            if isinstance(file_size, ToolError):
+                return file_size
 
             assert params.line_offset >= 1
             assert params.n_lines >= 1
@@ -88,7 +99,7 @@ class ReadFile(CallableTool2[Params]):
             max_lines_reached = False
             max_bytes_reached = False
             current_line_no = 0
-            async for line in p.read_lines(errors="replace"):
+            async for line in _iter_lines(p, file_size):
                 current_line_no += 1
                 if current_line_no < params.line_offset:
                     continue
@@ -96,7 +107,8 @@ class ReadFile(CallableTool2[Params]):
                 if truncated != line:
                     truncated_line_numbers.append(current_line_no)
                 lines.append(truncated)
-                n_bytes += len(truncated.encode("utf-8"))
+                # `isascii` is a flag check on str, so only non-ASCII lines pay for encoding
+                n_bytes += len(truncated) if truncated.isascii() else len(truncated.encode("utf-8"))
                 if len(lines) >= params.n_lines:
                     break
                 if len(lines) >= MAX_LINES:
@@ -106,13 +118,11 @@ class ReadFile(CallableTool2[Params]):
                     max_bytes_reached = True
                     break
 
-            # Format output with line numbers like `cat -n`
-            lines_with_no: list[str] = []
-            for line_num, line in zip(
-                range(params.line_offset, params.line_offset + len(lines)), lines, strict=True
-            ):
-                # Use 6-digit line number width, right-aligned, with tab separator
-                lines_with_no.append(f"{line_num:6d}\t{line}")
+            # Format output with line numbers like `cat -n`, using 6-digit line number width,
+            # right-aligned, with tab separator; lines already contain \n, so just join them
+            output = "".join(
+                map(_NUMBERED_LINE.__mod__, zip(itertools.count(params.line_offset), lines))
+            )
 
             message = (
                 f"{len(lines)} lines read from file starting from line {params.line_offset}."
@@ -128,7 +138,7 @@ class ReadFile(CallableTool2[Params]):
             if truncated_line_numbers:
                 message += f" Lines {truncated_line_numbers} were truncated."
             return ToolOk(
-                output="".join(lines_with_no),  # lines already contain \n, just join them
+                output=output,
                 message=message,
             )
         except Exception as e:
@@ -8,7 +8,7 @@ from pydantic import BaseModel, Field
 from kimi_cli.soul.agent import BuiltinSystemPromptArgs
 from kimi_cli.soul.approval import Approval
 from kimi_cli.tools.file import FileActions
-from kimi_cli.tools.utils import ToolRejectedError, load_desc
+from kimi_cli.tools.utils import TOOL_REJECTED, lazy_desc, regular_file_size
 from kimi_cli.utils.path import is_within_directory
 
 
@@ -30,7 +30,7 @@ class Params(BaseModel):
 
 class StrReplaceFile(CallableTool2[Params]):
     name: str = "StrReplaceFile"
-    description: str = load_desc(Path(__file__).parent / "replace.md")
+    description: str = lazy_desc(Path(__file__).parent / "replace.md")
     params: type[Params] = Params
 
     def __init__(self, builtin_args: BuiltinSystemPromptArgs, approval: Approval):
@@ -54,12 +54,22 @@ class StrReplaceFile(CallableTool2[Params]):
             )
         return None
 
-    def _apply_edit(self, content: str, edit: Edit) -> str:
-        """Apply a single edit to the content."""
-        if edit.replace_all:
-            return content.replace(edit.old, edit.new)
-        else:
-            return content.replace(edit.old, edit.new, 1)
+    def _apply_edit(self, content: str, edit: Edit) -> tuple[str, int]:
+        """Apply a single edit to the content, return the new content and the replacement count."""
+        if not edit.old:
+            # `str.split` does not accept an empty separator
+            if edit.replace_all:
+                return content.replace(edit.old, edit.new), len(content) + 1
+            return content.replace(edit.old, edit.new, 1), 1
+        # locate the first occurrence once, so that an absent string costs a single scan and the
+        # text before the first occurrence is neither split nor rejoined
+        start = content.find(edit.old)
+        if start == -1:
+            return content, 0
+        if not edit.replace_all:
+            return content[:start] + edit.new + content[start + len(edit.old) :], 1
+        parts = content[start:].split(edit.old)
+        return content[:start] + edit.new.join(parts), len(parts) - 1
 
     @override
     async def __call__(self, params: Params) -> ToolReturnValue:
@@ -80,16 +90,9 @@ class StrReplaceFile(CallableTool2[Params]):
             if path_error:
                 return path_error
 
-            if not await p.exists():
-                return ToolError(
-                    message=f"`{params.path}` does not exist.",
-                    brief="File not found",
-                )
-            if not await p.is_file():
-                return ToolError(
-                    message=f"`{params.path}` is not a file.",
-                    brief="Invalid path",
-                )
+            file_size = await regular_file_size(p, params.path)
+            if isinstance(file_size, ToolError):
+                return file_size
 
             # Request approval
             if not await self._approval.request(
@@ -97,20 +100,22 @@ class StrReplaceFile(CallableTool2[Params]):
                 FileActions.EDIT,
                 f"Edit file `{params.path}`",
             ):
-                return ToolRejectedError()
+                return TOOL_REJECTED
 
-            # Read the file content
+            # Read the file content, in text mode so that line endings match what ReadFile shows
             content = await p.read_text(errors="replace")
 
             original_content = content
             edits = [params.edit] if isinstance(params.edit, Edit) else params.edit
 
             # Apply all edits
+            total_replacements = 0
             for edit in edits:
-                content = self._apply_edit(content, edit)
+                content, n_replacements = self._apply_edit(content, edit)
+                total_replacements += n_replacements
 
             # Check if any changes were made
-            if content == original_content:
+            if total_replacements == 0 or content == original_content:
                 return ToolError(
                     message="No replacements were made. The old string was not found in the file.",
                     brief="No replacements made",
@@ -119,14 +124,6 @@ class StrReplaceFile(CallableTool2[Params]):
             # Write the modified content back to the file
             await p.write_text(content, errors="replace")
 
-            # Count changes for success message
-            total_replacements = 0
-            for edit in edits:
-                if edit.replace_all:
-                    total_replacements += original_content.count(edit.old)
-                else:
-                    total_replacements += 1 if edit.old in original_content else 0
-
             return ToolOk(
                 output="",
                 message=(
@@ -8,7 +8,7 @@ from pydantic import BaseModel, Field
 from kimi_cli.soul.agent import BuiltinSystemPromptArgs
 from kimi_cli.soul.approval import Approval
 from kimi_cli.tools.file import FileActions
-from kimi_cli.tools.utils import ToolRejectedError, load_desc
+from kimi_cli.tools.utils import TOOL_REJECTED, lazy_desc
 from kimi_cli.utils.path import is_within_directory
 
 
@@ -27,12 +27,14 @@ class Params(BaseModel):
 
 class WriteFile(CallableTool2[Params]):
     name: str = "WriteFile"
-    description: str = load_desc(Path(__file__).parent / "write.md")
+    description: str = lazy_desc(Path(__file__).parent / "write.md")
     params: type[Params] = Params
 
     def __init__(self, builtin_args: BuiltinSystemPromptArgs, approval: Approval):
         super().__init__()
         self._work_dir = builtin_args.KIMI_WORK_DIR
+        # joining a dummy name gives the prefix with the right separator, even for a root dir
+        self._work_dir_prefix = str(self._work_dir / "_")[:-1]
         self._approval = approval
 
     async def _validate_path(self, path: KaosPath) -> ToolError | None:
@@ -40,7 +42,10 @@ class WriteFile(CallableTool2[Params]):
         # Check for path traversal attempts
         resolved_path = path.canonical()
 
-        # Ensure the path is within work directory
+        # Ensure the path is within work directory, where a canonical path that starts with the
+        # work directory prefix obviously is
+        if str(resolved_path).startswith(self._work_dir_prefix):
+            return None
         if not is_within_directory(resolved_path, self._work_dir):
             return ToolError(
                 message=(
@@ -95,7 +100,7 @@ class WriteFile(CallableTool2[Params]):
                 FileActions.EDIT,
                 f"Write file `{params.path}`",
             ):
-                return ToolRejectedError()
+                return TOOL_REJECTED
 
             # Write content to file
             match params.mode:
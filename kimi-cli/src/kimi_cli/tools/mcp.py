@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from typing import Any
 
 import fastmcp
@@ -8,7 +9,7 @@ from kosong.message import AudioURLPart, ContentPart, ImageURLPart, TextPart
 from kosong.tooling import CallableTool, ToolError, ToolOk, ToolReturnValue
 
 from kimi_cli.soul.agent import Runtime
-from kimi_cli.tools.utils import ToolRejectedError
+from kimi_cli.tools.utils import TOOL_REJECTED
 
 
 class MCPTool[T: ClientTransport](CallableTool):
@@ -34,7 +35,7 @@ class MCPTool[T: ClientTransport](CallableTool):
     async def __call__(self, *args: Any, **kwargs: Any) -> ToolReturnValue:
         description = f"Call MCP tool `{self._mcp_tool.name}`."
         if not await self._runtime.approval.request(self.name, self._action_name, description):
-            return ToolRejectedError()
+            return TOOL_REJECTED
 
         async with self._client as client:
             result = await client.call_tool(
@@ -43,6 +44,21 @@ class MCPTool[T: ClientTransport](CallableTool):
             return convert_tool_result(result)
 
 
+_MEDIA_PARTS: dict[str, Callable[[str], ContentPart]] = {
+    "image": lambda url: ImageURLPart(image_url=ImageURLPart.ImageURL(url=url)),
+    "audio": lambda url: AudioURLPart(audio_url=AudioURLPart.AudioURL(url=url)),
+}
+"""Content part constructors by the top-level type of a media type."""
+
+
+def _media_part(url: str, mime_type: str) -> ContentPart:
+    top_level_type, slash, _ = mime_type.partition("/")
+    make_part = _MEDIA_PARTS.get(top_level_type) if slash else None
+    if make_part is None:
+        raise ValueError(f"Unsupported mime type: {mime_type}")
+    return make_part(url)
+
+
 def convert_tool_result(result: CallToolResult) -> ToolReturnValue:
     content: list[ContentPart] = []
     for part in result.content:
@@ -65,42 +81,9 @@ def convert_tool_result(result: CallToolResult) -> ToolReturnValue:
                 resource=mcp.types.BlobResourceContents(uri=_uri, mimeType=mimeType, blob=blob)
             ):
                 mimeType = mimeType or "application/octet-stream"
-                if mimeType.startswith("image/"):
-                    content.append(
-                        ImageURLPart(
-                            type="image_url",
-                            image_url=ImageURLPart.ImageURL(
-                                url=f"data:{mimeType};base64,{blob}",
-                            ),
-                        )
-                    )
-                elif mimeType.startswith("audio/"):
-                    content.append(
-                        AudioURLPart(
-                            type="audio_url",
-                            audio_url=AudioURLPart.AudioURL(url=f"data:{mimeType};base64,{blob}"),
-                        )
-                    )
-                else:
-                    raise ValueError(f"Unsupported mime type: {mimeType}")
+                content.append(_media_part(f"data:{mimeType};base64,{blob}", mimeType))
             case mcp.types.ResourceLink(uri=uri, mimeType=mimeType, description=_description):
-                mimeType = mimeType or "application/octet-stream"
-                if mimeType.startswith("image/"):
-                    content.append(
-                        ImageURLPart(
-                            type="image_url",
-                            image_url=ImageURLPart.ImageURL(url=str(uri)),
-                        )
-                    )
-                elif mimeType.startswith("audio/"):
-                    content.append(
-                        AudioURLPart(
-                            type="audio_url",
-                            audio_url=AudioURLPart.AudioURL(url=str(uri)),
-                        )
-                    )
-                else:
-                    raise ValueError(f"Unsupported mime type: {mimeType}")
+                content.append(_media_part(str(uri), mimeType or "application/octet-stream"))
             case _:
                 raise ValueError(f"Unsupported MCP tool result part: {part}")
     if result.is_error:
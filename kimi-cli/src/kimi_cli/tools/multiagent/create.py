@@ -1,3 +1,4 @@
+import itertools
 from pathlib import Path
 
 from kosong.tooling import CallableTool2, ToolError, ToolOk, ToolReturnValue
@@ -5,7 +6,7 @@ from pydantic import BaseModel, Field
 
 from kimi_cli.soul.agent import Agent, Runtime
 from kimi_cli.soul.toolset import KimiToolset
-from kimi_cli.tools.utils import load_desc
+from kimi_cli.tools.utils import lazy_desc
 
 
 class Params(BaseModel):
@@ -22,7 +23,7 @@ class Params(BaseModel):
 
 class CreateSubagent(CallableTool2[Params]):
     name: str = "CreateSubagent"
-    description: str = load_desc(Path(__file__).parent / "create.md")
+    description: str = lazy_desc(Path(__file__).parent / "create.md")
     params: type[Params] = Params
 
     def __init__(self, toolset: KimiToolset, runtime: Runtime):
@@ -31,7 +32,8 @@ class CreateSubagent(CallableTool2[Params]):
         self._runtime = runtime
 
     async def __call__(self, params: Params) -> ToolReturnValue:
-        if params.name in self._runtime.labor_market.subagents:
+        labor_market = self._runtime.labor_market
+        if labor_market.get_subagent(params.name) is not None:
             return ToolError(
                 message=f"Subagent with name '{params.name}' already exists.",
                 brief="Subagent already exists",
@@ -43,8 +45,12 @@ class CreateSubagent(CallableTool2[Params]):
             toolset=self._toolset,  # share the same toolset as the parent agent
             runtime=self._runtime.copy_for_dynamic_subagent(),
         )
-        self._runtime.labor_market.add_dynamic_subagent(params.name, subagent)
+        labor_market.add_dynamic_subagent(params.name, subagent)
+        # dynamic subagents never take the name of another subagent, so the names do not overlap
+        subagent_names = itertools.chain(
+            labor_market.fixed_subagents, labor_market.dynamic_subagents
+        )
         return ToolOk(
-            output="Available subagents: " + ", ".join(self._runtime.labor_market.subagents.keys()),
+            output="Available subagents: " + ", ".join(subagent_names),
             message=f"Subagent '{params.name}' created successfully.",
         )
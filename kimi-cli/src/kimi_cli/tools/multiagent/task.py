@@ -56,16 +56,13 @@ class Task(CallableTool2[Params]):
         super().__init__(
             description=load_desc(
                 Path(__file__).parent / "task.md",
-                {
-                    "SUBAGENTS_MD": "\n".join(
-                        f"- `{name}`: {desc}"
-                        for name, desc in runtime.labor_market.fixed_subagent_descs.items()
-                    ),
-                },
+                {"SUBAGENTS_MD": runtime.labor_market.fixed_subagents_md},
             ),
         )
         self._labor_market = runtime.labor_market
         self._session = runtime.session
+        # the rotation number to try for the next subagent context file, once one is known
+        self._next_subagent_num: int | None = None
 
     async def _get_subagent_context_file(self) -> Path:
         """Generate a unique context file path for subagent."""
@@ -73,21 +70,22 @@ class Task(CallableTool2[Params]):
         subagent_base_name = f"{main_context_file.stem}_sub"
         main_context_file.parent.mkdir(parents=True, exist_ok=True)  # just in case
         sub_context_file = await next_available_rotation(
-            main_context_file.parent / f"{subagent_base_name}{main_context_file.suffix}"
+            main_context_file.parent / f"{subagent_base_name}{main_context_file.suffix}",
+            start=self._next_subagent_num,
         )
         assert sub_context_file is not None
+        # later subagents continue from here instead of listing the session directory again
+        self._next_subagent_num = int(sub_context_file.stem.rpartition("_")[2]) + 1
         return sub_context_file
 
     @override
     async def __call__(self, params: Params) -> ToolReturnValue:
-        subagents = self._labor_market.subagents
-
-        if params.subagent_name not in subagents:
+        agent = self._labor_market.get_subagent(params.subagent_name)
+        if agent is None:
             return ToolError(
                 message=f"Subagent not found: {params.subagent_name}",
                 brief="Subagent not found",
             )
-        agent = subagents[params.subagent_name]
         try:
             result = await self._run_subagent(agent, params.prompt)
             return result
@@ -120,8 +118,14 @@ class Task(CallableTool2[Params]):
         async def _ui_loop_fn(wire: Wire) -> None:
             wire_ui = wire.ui_side(merge=True)
             while True:
-                msg = await wire_ui.receive()
-                _super_wire_send(msg)
+                _super_wire_send(await wire_ui.receive())
+                # forward a burst of messages in one go instead of waking up for each of them
+                while True:
+                    try:
+                        msg = wire_ui.receive_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    _super_wire_send(msg)
 
         subagent_context_file = await self._get_subagent_context_file()
         context = Context(file_backend=subagent_context_file)
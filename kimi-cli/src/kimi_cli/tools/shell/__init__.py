@@ -1,4 +1,5 @@
 import asyncio
+import codecs
 from collections.abc import Callable
 from pathlib import Path
 from typing import override
@@ -9,11 +10,21 @@ from kosong.tooling import CallableTool2, ToolReturnValue
 from pydantic import BaseModel, Field
 
 from kimi_cli.soul.approval import Approval
-from kimi_cli.tools.utils import ToolRejectedError, ToolResultBuilder, load_desc
+from kimi_cli.tools.utils import (
+    DEFAULT_MAX_LINE_LENGTH,
+    TOOL_REJECTED,
+    ToolResultBuilder,
+    load_desc,
+)
 from kimi_cli.utils.environment import Environment
 
 MAX_TIMEOUT = 5 * 60
 
+_READ_CHUNK_SIZE = 64 << 10
+_MAX_LINE_HEAD_BYTES = (DEFAULT_MAX_LINE_LENGTH + 1) * 4
+"""Enough bytes of a line for `ToolResultBuilder` to tell that it must be truncated."""
+_UTF8_DECODER = codecs.getincrementaldecoder("utf-8")
+
 
 class Params(BaseModel):
     command: str = Field(description="The bash command to execute.")
@@ -41,8 +52,10 @@ class Shell(CallableTool2[Params]):
             )
         )
         self._approval = approval
-        self._is_powershell = is_powershell
-        self._shell_path = environment.shell_path
+        self._shell_prefix = (
+            str(environment.shell_path),
+            "-command" if is_powershell else "-c",
+        )
 
     @override
     async def __call__(self, params: Params) -> ToolReturnValue:
@@ -53,19 +66,15 @@ class Shell(CallableTool2[Params]):
             "run shell command",
             f"Run command `{params.command}`",
         ):
-            return ToolRejectedError()
-
-        def stdout_cb(line: bytes):
-            line_str = line.decode(encoding="utf-8", errors="replace")
-            builder.write(line_str)
-
-        def stderr_cb(line: bytes):
-            line_str = line.decode(encoding="utf-8", errors="replace")
-            builder.write(line_str)
+            return TOOL_REJECTED
 
         try:
             exitcode = await self._run_shell_command(
-                params.command, stdout_cb, stderr_cb, params.timeout
+                params.command,
+                builder.write,
+                builder.write,
+                params.timeout,
+                output_full=lambda: builder.is_full,
             )
 
             if exitcode == 0:
@@ -84,17 +93,43 @@ class Shell(CallableTool2[Params]):
     async def _run_shell_command(
         self,
         command: str,
-        stdout_cb: Callable[[bytes], None],
-        stderr_cb: Callable[[bytes], None],
+        stdout_cb: Callable[[str], object],
+        stderr_cb: Callable[[str], object],
         timeout: int,
+        *,
+        output_full: Callable[[], bool] = lambda: False,
     ) -> int:
-        async def _read_stream(stream: AsyncReadable, cb: Callable[[bytes], None]):
-            while True:
-                line = await stream.readline()
-                if line:
-                    cb(line)
-                else:
-                    break
+        async def _read_stream(stream: AsyncReadable, cb: Callable[[str], object]):
+            # read in large chunks instead of awaiting every line, but only pass complete lines
+            # on, so that lines of stdout and stderr are not interleaved midway
+            decoder = _UTF8_DECODER(errors="replace")
+            pending = b""
+            skipping_line = False
+            while chunk := await stream.read(_READ_CHUNK_SIZE):
+                if output_full():
+                    # nothing more can be kept, but keep draining the pipe so that the command
+                    # does not block on writing to it
+                    continue
+                if skipping_line:
+                    # the rest of a line that is too long to be kept, up to its line break
+                    line_end = chunk.find(b"\n")
+                    if line_end < 0:
+                        continue
+                    chunk = chunk[line_end:]
+                    skipping_line = False
+                data = pending + chunk
+                end = data.rfind(b"\n") + 1
+                if end > 0:
+                    cb(decoder.decode(data[:end]))
+                pending = data[end:]
+                if len(pending) > _MAX_LINE_HEAD_BYTES:
+                    # the line will be truncated anyway, so do not wait for or decode the rest
+                    cb(decoder.decode(pending[:_MAX_LINE_HEAD_BYTES]))
+                    decoder.reset()
+                    pending = b""
+                    skipping_line = True
+            if not output_full() and (rest := decoder.decode(pending, final=True)):
+                cb(rest)
 
         process = await kaos.exec(*self._shell_args(command))
 
@@ -112,6 +147,4 @@ class Shell(CallableTool2[Params]):
             raise
 
     def _shell_args(self, command: str) -> tuple[str, ...]:
-        if self._is_powershell:
-            return (str(self._shell_path), "-command", command)
-        return (str(self._shell_path), "-c", command)
+        return (*self._shell_prefix, command)
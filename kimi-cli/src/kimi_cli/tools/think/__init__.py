@@ -4,7 +4,10 @@ from typing import override
 from kosong.tooling import CallableTool2, ToolOk, ToolReturnValue
 from pydantic import BaseModel, Field
 
-from kimi_cli.tools.utils import load_desc
+from kimi_cli.tools.utils import lazy_desc
+
+_THOUGHT_LOGGED = ToolOk(output="", message="Thought logged")
+"""The result of every `Think` call, which is never modified after being returned."""
 
 
 class Params(BaseModel):
@@ -13,9 +16,9 @@ class Params(BaseModel):
 
 class Think(CallableTool2[Params]):
     name: str = "Think"
-    description: str = load_desc(Path(__file__).parent / "think.md", {})
+    description: str = lazy_desc(Path(__file__).parent / "think.md", {})
     params: type[Params] = Params
 
     @override
     async def __call__(self, params: Params) -> ToolReturnValue:
-        return ToolOk(output="", message="Thought logged")
+        return _THOUGHT_LOGGED
@@ -4,7 +4,7 @@ from typing import Literal, override
 from kosong.tooling import CallableTool2, ToolOk, ToolReturnValue
 from pydantic import BaseModel, Field
 
-from kimi_cli.tools.utils import load_desc
+from kimi_cli.tools.utils import lazy_desc
 
 
 class Todo(BaseModel):
@@ -12,24 +12,23 @@ class Todo(BaseModel):
     status: Literal["Pending", "In Progress", "Done"] = Field(description="The status of the todo")
 
 
+_TODO_FORMATS: dict[str, str] = {
+    "Pending": "- %s [Pending]\n",
+    "In Progress": "- **%s** [In Progress]\n",
+    "Done": "- ~~%s~~ [Done]\n",
+}
+
+
 class Params(BaseModel):
     todos: list[Todo] = Field(description="The updated todo list")
 
 
 class SetTodoList(CallableTool2[Params]):
     name: str = "SetTodoList"
-    description: str = load_desc(Path(__file__).parent / "set_todo_list.md")
+    description: str = lazy_desc(Path(__file__).parent / "set_todo_list.md")
     params: type[Params] = Params
 
     @override
     async def __call__(self, params: Params) -> ToolReturnValue:
-        rendered = ""
-        for todo in params.todos:
-            match todo.status:
-                case "Done":
-                    rendered += f"- ~~{todo.title}~~ [{todo.status}]\n"
-                case "In Progress":
-                    rendered += f"- **{todo.title}** [{todo.status}]\n"
-                case _:
-                    rendered += f"- {todo.title} [{todo.status}]\n"
+        rendered = "".join(_TODO_FORMATS[todo.status] % todo.title for todo in params.todos)
         return ToolOk(output="", message="Todo list updated", brief=rendered)
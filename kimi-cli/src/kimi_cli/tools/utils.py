@@ -1,16 +1,50 @@
 import re
+import stat
 import string
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import cast
 
+from kaos.path import KaosPath
 from kosong.tooling import ToolError, ToolOk
 
 
+@cache
+def _read_desc(path: Path) -> str:
+    # description files are shipped with the package and never change at runtime
+    return path.read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=64)
+def _render_desc(path: Path, substitutions: frozenset[tuple[str, str]]) -> str:
+    return string.Template(_read_desc(path)).safe_substitute(dict(substitutions))
+
+
 def load_desc(path: Path, substitutions: dict[str, str] | None = None) -> str:
     """Load a tool description from a file, with optional substitutions."""
-    description = path.read_text(encoding="utf-8")
-    if substitutions:
-        description = string.Template(description).safe_substitute(substitutions)
-    return description
+    if not substitutions:
+        return _read_desc(path)
+    # tools constructed per agent (e.g. `Shell`) render the same description every time
+    return _render_desc(path, frozenset(substitutions.items()))
+
+
+class _LazyDesc:
+    def __init__(self, path: Path, substitutions: dict[str, str] | None) -> None:
+        self._path = path
+        self._substitutions = substitutions
+
+    def __get__(self, instance: object, owner: type | None = None) -> str:
+        # `load_desc` caches both the file content and the rendered description
+        return load_desc(self._path, self._substitutions)
+
+
+def lazy_desc(path: Path, substitutions: dict[str, str] | None = None) -> str:
+    """
+    Like `load_desc`, but for a class attribute, which is only loaded from the file when first
+    accessed instead of when the class is defined at import time.
+    """
+    # the descriptor resolves to `str` on attribute access, which is all that callers can see
+    return cast(str, _LazyDesc(path, substitutions))
 
 
 def truncate_line(line: str, max_length: int, marker: str = "...") -> str:
@@ -29,6 +63,26 @@ def truncate_line(line: str, max_length: int, marker: str = "...") -> str:
     return line[: max_length - len(end)] + end
 
 
+async def regular_file_size(p: KaosPath, display_path: str) -> int | ToolError:
+    """
+    Get the size of a regular file with a single `stat`, or the error to report if `p` does not
+    exist or is not a regular file.
+    """
+    try:
+        st = await p.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return ToolError(
+            message=f"`{display_path}` does not exist.",
+            brief="File not found",
+        )
+    if not stat.S_ISREG(st.st_mode):
+        return ToolError(
+            message=f"`{display_path}` is not a file.",
+            brief="Invalid path",
+        )
+    return st.st_size
+
+
 # Default output limits
 DEFAULT_MAX_CHARS = 50_000
 DEFAULT_MAX_LINE_LENGTH = 2000
@@ -64,6 +118,17 @@ class ToolResultBuilder:
         if self.is_full:
             return 0
 
+        n_chars = len(text)
+        if self._n_chars + n_chars <= self.max_chars and (
+            self.max_line_length is None or n_chars <= self.max_line_length
+        ):
+            # nothing can be truncated, so there is no need to go through the text line by line
+            if n_chars:
+                self._buffer.append(text)
+                self._n_chars += n_chars
+                self._n_lines += text.count("\n")
+            return n_chars
+
         lines = text.splitlines(keepends=True)
         if not lines:
             return 0
@@ -148,3 +213,7 @@ class ToolRejectedError(ToolError):
             ),
             brief="Rejected by user",
         )
+
+
+TOOL_REJECTED = ToolRejectedError()
+"""The result of a tool call rejected by the user, shared as it is never modified."""
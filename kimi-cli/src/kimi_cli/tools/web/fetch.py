@@ -1,5 +1,11 @@
+import asyncio
+import ipaddress
+import time
+from collections import OrderedDict
+from datetime import date
 from pathlib import Path
 from typing import override
+from urllib.parse import urlsplit
 
 import aiohttp
 import trafilatura
@@ -9,10 +15,104 @@ from pydantic import BaseModel, Field
 from kimi_cli.config import Config
 from kimi_cli.constant import USER_AGENT
 from kimi_cli.soul.toolset import get_current_tool_call_or_none
-from kimi_cli.tools.utils import ToolResultBuilder, load_desc
-from kimi_cli.utils.aiohttp import new_client_session
+from kimi_cli.tools.utils import ToolResultBuilder, lazy_desc
+from kimi_cli.utils.aiohttp import shared_client_session
 from kimi_cli.utils.logging import logger
 
+_MAX_CONCURRENT_REQUESTS = 16
+"""Maximum number of requests a `FetchURL` tool has in flight at once."""
+_MAX_BODY_BYTES = 4 << 20
+"""Maximum number of bytes read from a response body, the rest is not downloaded."""
+_READ_CHUNK_SIZE = 64 << 10
+_RAW_TEXT_CONTENT_TYPES = (
+    "text/plain",
+    "text/markdown",
+    "application/json",
+    "application/xml",
+    "application/javascript",
+)
+"""Content types returned as they are, without extracting the main text of the page."""
+_TEXT_CONTENT_TYPES = ("text/", "application/xhtml+xml")
+_BROWSER_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+    ),
+}
+"""Headers for fetching pages directly, as a browser would."""
+_CACHE_MAX_SIZE = 256
+"""Maximum number of results a `FetchURL` tool keeps in its cache."""
+_CACHE_TTL = 300.0
+"""Seconds a successful result is reused for repeated fetches of the same URL."""
+
+
+def _is_cacheable(url: str) -> bool:
+    # pages served from this machine or the local network are likely being worked on, and a
+    # refetch is expected to see the changes
+    try:
+        host = urlsplit(url).hostname
+    except ValueError:
+        return False
+    if not host:
+        return False
+    if host == "localhost" or host.endswith(".localhost"):
+        return False
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return True
+    return not (address.is_loopback or address.is_private)
+
+
+def _is_raw_text(mime_type: str) -> bool:
+    if mime_type.startswith(_RAW_TEXT_CONTENT_TYPES):
+        return True
+    # RSS and Atom feeds, SVG and the like are XML documents, unlike XHTML pages
+    return mime_type.endswith("+xml") and mime_type != "application/xhtml+xml"
+
+
+async def _read_body(response: aiohttp.ClientResponse) -> tuple[bytes, bool]:
+    """
+    Read the response body, up to `_MAX_BODY_BYTES`. Returns the body and whether it was
+    truncated.
+    """
+    chunks: list[bytes] = []
+    n_bytes = 0
+    while n_bytes < _MAX_BODY_BYTES:
+        chunk = await response.content.read(min(_READ_CHUNK_SIZE, _MAX_BODY_BYTES - n_bytes))
+        if not chunk:
+            break
+        chunks.append(chunk)
+        n_bytes += len(chunk)
+    # the body may end right at the limit
+    truncated = n_bytes >= _MAX_BODY_BYTES and bool(await response.content.read(1))
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks), truncated
+
+
+def _decode_body(body: bytes, charset: str | None) -> str:
+    # like `ClientResponse.text`, fall back to UTF-8 when the server does not declare a charset
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _extract_main_text(html: str | bytes) -> str | None:
+    return trafilatura.extract(
+        html,
+        include_comments=True,
+        include_tables=True,
+        include_formatting=False,
+        output_format="txt",
+        with_metadata=True,
+        # the extensive date search of `htmldate` dominates the extraction time
+        date_extraction_params={
+            "original_date": True,
+            "extensive_search": False,
+            "max_date": date.today().isoformat(),
+        },
+    )
+
 
 class Params(BaseModel):
     url: str = Field(description="The URL to fetch content from.")
@@ -20,15 +120,48 @@ class Params(BaseModel):
 
 class FetchURL(CallableTool2[Params]):
     name: str = "FetchURL"
-    description: str = load_desc(Path(__file__).parent / "fetch.md", {})
+    description: str = lazy_desc(Path(__file__).parent / "fetch.md", {})
     params: type[Params] = Params
 
     def __init__(self, config: Config):
         super().__init__()
         self._service_config = config.services.moonshot_fetch
+        self._service_headers: dict[str, str] = {}
+        """Headers for the fetch service, except the per-call tool call ID."""
+        if self._service_config is not None:
+            self._service_headers = {
+                "User-Agent": USER_AGENT,
+                "Authorization": f"Bearer {self._service_config.api_key.get_secret_value()}",
+                "Accept": "text/markdown",
+                **(self._service_config.custom_headers or {}),
+            }
+        self._request_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        self._cache: OrderedDict[str, tuple[float, ToolOk]] = OrderedDict()
+        """Successful results by URL, with the time they were fetched, least recently used first."""
 
     @override
     async def __call__(self, params: Params) -> ToolReturnValue:
+        cached = self._cache.get(params.url)
+        if cached is not None:
+            fetched_at, ret = cached
+            age = time.monotonic() - fetched_at
+            if age < _CACHE_TTL:
+                self._cache.move_to_end(params.url)
+                # the page may have changed since, which the model should be able to tell
+                message = f"The content is cached from a fetch {int(age)} seconds ago."
+                if ret.message:
+                    message = f"{ret.message} {message}"
+                return ret.model_copy(update={"message": message})
+            del self._cache[params.url]
+
+        ret = await self._fetch(params)
+        if isinstance(ret, ToolOk) and _is_cacheable(params.url):
+            self._cache[params.url] = (time.monotonic(), ret)
+            if len(self._cache) > _CACHE_MAX_SIZE:
+                self._cache.popitem(last=False)
+        return ret
+
+    async def _fetch(self, params: Params) -> ToolReturnValue:
         if self._service_config:
             ret = await self._fetch_with_service(params)
             if isinstance(ret, ToolOk):
@@ -37,20 +170,14 @@ class FetchURL(CallableTool2[Params]):
             # fallback to local fetch if service fetch fails
         return await self.fetch_with_http_get(params)
 
-    @staticmethod
-    async def fetch_with_http_get(params: Params) -> ToolReturnValue:
+    async def fetch_with_http_get(self, params: Params) -> ToolReturnValue:
         builder = ToolResultBuilder(max_line_length=None)
         try:
             async with (
-                new_client_session() as session,
-                session.get(
+                self._request_semaphore,
+                shared_client_session().get(
                     params.url,
-                    headers={
-                        "User-Agent": (
-                            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                            "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-                        ),
-                    },
+                    headers=_BROWSER_HEADERS,
                 ) as response,
             ):
                 if response.status >= 400:
@@ -62,11 +189,29 @@ class FetchURL(CallableTool2[Params]):
                         brief=f"HTTP {response.status} error",
                     )
 
-                resp_text = await response.text()
-
                 content_type = response.headers.get(aiohttp.hdrs.CONTENT_TYPE, "").lower()
-                if content_type.startswith(("text/plain", "text/markdown")):
-                    builder.write(resp_text)
+                mime_type = content_type.partition(";")[0].strip()
+                if mime_type and not (
+                    mime_type.startswith(_TEXT_CONTENT_TYPES) or _is_raw_text(mime_type)
+                ):
+                    # do not download binary content (e.g. PDFs and images) that cannot be read
+                    return builder.error(
+                        (
+                            f"Failed to fetch URL. Unsupported content type: {mime_type}. "
+                            "Only text, HTML, JSON, XML and JavaScript pages can be fetched."
+                        ),
+                        brief="Unsupported content type",
+                    )
+
+                body, truncated = await _read_body(response)
+                charset = response.charset
+                if _is_raw_text(mime_type):
+                    builder.write(_decode_body(body, charset))
+                    if truncated:
+                        return builder.ok(
+                            f"The returned content is the first {_MAX_BODY_BYTES >> 20} MB of "
+                            "the page, the rest was not fetched."
+                        )
                     return builder.ok("The returned content is the full content of the page.")
         except aiohttp.ClientError as e:
             return builder.error(
@@ -77,20 +222,17 @@ class FetchURL(CallableTool2[Params]):
                 brief="Network error",
             )
 
-        if not resp_text:
+        if not body:
             return builder.ok(
                 "The response body is empty.",
                 brief="Empty response body",
             )
 
-        extracted_text = trafilatura.extract(
-            resp_text,
-            include_comments=True,
-            include_tables=True,
-            include_formatting=False,
-            output_format="txt",
-            with_metadata=True,
-        )
+        # without a declared charset, let trafilatura detect the encoding of the raw page, which
+        # also takes the charset given by the page itself (`<meta charset=...>`) into account
+        html = _decode_body(body, charset) if charset else body
+        # parsing and pruning the page is CPU-bound, keep it off the event loop
+        extracted_text = await asyncio.to_thread(_extract_main_text, html)
 
         if not extracted_text:
             return builder.error(
@@ -103,7 +245,13 @@ class FetchURL(CallableTool2[Params]):
             )
 
         builder.write(extracted_text)
-        return builder.ok("The returned content is the main text content extracted from the page.")
+        message = "The returned content is the main text content extracted from the page."
+        if truncated:
+            message += (
+                f" The page is larger than {_MAX_BODY_BYTES >> 20} MB, "
+                "only the text of its beginning was extracted."
+            )
+        return builder.ok(message)
 
     async def _fetch_with_service(self, params: Params) -> ToolReturnValue:
         assert self._service_config is not None
@@ -112,18 +260,13 @@ class FetchURL(CallableTool2[Params]):
         assert tool_call is not None, "Tool call is expected to be set"
 
         builder = ToolResultBuilder(max_line_length=None)
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Authorization": f"Bearer {self._service_config.api_key.get_secret_value()}",
-            "Accept": "text/markdown",
-            "X-Msh-Tool-Call-Id": tool_call.id,
-            **(self._service_config.custom_headers or {}),
-        }
+        # custom headers are allowed to override the tool call ID, as well as the others
+        headers = {"X-Msh-Tool-Call-Id": tool_call.id, **self._service_headers}
 
         try:
             async with (
-                new_client_session() as session,
-                session.post(
+                self._request_semaphore,
+                shared_client_session().post(
                     self._service_config.base_url,
                     headers=headers,
                     json={"url": params.url},
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from typing import override
 
@@ -8,8 +9,11 @@ from kimi_cli.config import Config
 from kimi_cli.constant import USER_AGENT
 from kimi_cli.soul.toolset import get_current_tool_call_or_none
 from kimi_cli.tools import SkipThisTool
-from kimi_cli.tools.utils import ToolResultBuilder, load_desc
-from kimi_cli.utils.aiohttp import new_client_session
+from kimi_cli.tools.utils import ToolResultBuilder, lazy_desc
+from kimi_cli.utils.aiohttp import shared_client_session
+
+_MAX_CONCURRENT_REQUESTS = 4
+"""Maximum number of requests a `SearchWeb` tool has in flight to the search service at once."""
 
 
 class Params(BaseModel):
@@ -37,7 +41,7 @@ class Params(BaseModel):
 
 class SearchWeb(CallableTool2[Params]):
     name: str = "SearchWeb"
-    description: str = load_desc(Path(__file__).parent / "search.md", {})
+    description: str = lazy_desc(Path(__file__).parent / "search.md", {})
     params: type[Params] = Params
 
     def __init__(self, config: Config):
@@ -46,7 +50,13 @@ class SearchWeb(CallableTool2[Params]):
             raise SkipThisTool()
         self._base_url = config.services.moonshot_search.base_url
         self._api_key = config.services.moonshot_search.api_key.get_secret_value()
-        self._custom_headers = config.services.moonshot_search.custom_headers or {}
+        self._headers = {
+            "User-Agent": USER_AGENT,
+            "Authorization": f"Bearer {self._api_key}",
+            **(config.services.moonshot_search.custom_headers or {}),
+        }
+        """Headers for the search service, except the per-call tool call ID."""
+        self._request_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
 
     @override
     async def __call__(self, params: Params) -> ToolReturnValue:
@@ -62,15 +72,11 @@ class SearchWeb(CallableTool2[Params]):
         assert tool_call is not None, "Tool call is expected to be set"
 
         async with (
-            new_client_session() as session,
-            session.post(
+            self._request_semaphore,
+            shared_client_session().post(
                 self._base_url,
-                headers={
-                    "User-Agent": USER_AGENT,
-                    "Authorization": f"Bearer {self._api_key}",
-                    "X-Msh-Tool-Call-Id": tool_call.id,
-                    **self._custom_headers,
-                },
+                # custom headers are allowed to override the tool call ID, as well as the others
+                headers={"X-Msh-Tool-Call-Id": tool_call.id, **self._headers},
                 json={
                     "text_query": params.query,
                     "limit": params.limit,
@@ -89,7 +95,7 @@ class SearchWeb(CallableTool2[Params]):
                 )
 
             try:
-                results = Response(**await response.json()).search_results
+                results = Response.model_validate_json(await response.read()).search_results
             except ValidationError as e:
                 return builder.error(
                     (
@@ -99,15 +105,14 @@ class SearchWeb(CallableTool2[Params]):
                     brief="Failed to parse search results",
                 )
 
-        for i, result in enumerate(results):
-            if i > 0:
-                builder.write("---\n\n")
-            builder.write(
+        builder.write(
+            "---\n\n".join(
                 f"Title: {result.title}\nDate: {result.date}\n"
                 f"URL: {result.url}\nSummary: {result.snippet}\n\n"
+                + (f"{result.content}\n\n" if result.content else "")
+                for result in results
             )
-            if result.content:
-                builder.write(f"{result.content}\n\n")
+        )
 
         return builder.ok()
 
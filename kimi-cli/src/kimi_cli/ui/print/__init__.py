@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import sys
 from functools import partial
 from pathlib import Path
@@ -113,25 +112,27 @@ class Print:
 
     def _read_next_command(self) -> str | None:
         while True:
-            json_line = sys.stdin.readline()
+            # read bytes, which pydantic parses directly without decoding to `str` first
+            json_line = sys.stdin.buffer.readline()
             if not json_line:
                 # EOF
                 return None
 
-            json_line = json_line.strip()
-            if not json_line:
+            if json_line.isspace():
                 # for empty line, read next line
                 continue
 
             try:
-                data = json.loads(json_line)
-                message = Message.model_validate(data)
+                message = Message.model_validate_json(json_line)
                 if message.role == "user":
                     return message.extract_text(sep="\n")
                 logger.warning(
                     "Ignoring message with role `{role}`: {json_line}",
                     role=message.role,
-                    json_line=json_line,
+                    json_line=json_line.decode("utf-8", errors="replace").strip(),
                 )
             except Exception:
-                logger.warning("Ignoring invalid user message: {json_line}", json_line=json_line)
+                logger.warning(
+                    "Ignoring invalid user message: {json_line}",
+                    json_line=json_line.decode("utf-8", errors="replace").strip(),
+                )
@@ -1,5 +1,5 @@
 import asyncio
-from dataclasses import dataclass
+import sys
 from typing import Protocol
 
 import rich
@@ -26,71 +26,74 @@ class TextPrinter(Printer):
 
 
 class JsonPrinter(Printer):
-    @dataclass(slots=True)
-    class _ToolCallState:
-        tool_call: ToolCall
-        tool_result: ToolResult | None
-
     def __init__(self) -> None:
         self._content_buffer: list[ContentPart] = []
         """The buffer to merge content parts."""
-        self._tool_call_buffer: dict[str, JsonPrinter._ToolCallState] = {}
-        """The buffer to store tool calls and their results."""
+        self._tool_calls: list[ToolCall] = []
+        """The buffer to store tool calls."""
+        self._tool_results: list[ToolResult | None] = []
+        """The results of the tool calls in `_tool_calls`, at the same indices."""
+        self._tool_call_indices: dict[str, int] = {}
+        """The indices of the tool calls in `_tool_calls`, by tool call ID."""
         self._last_tool_call: ToolCall | None = None
 
     def feed(self, msg: WireMessage) -> None:
+        # content parts are streamed at token rate, check for them first
         match msg:
-            case StepBegin() | StepInterrupted():
-                self.flush()
             case ContentPart() as part:
                 # merge with previous parts as much as possible
                 if not self._content_buffer or not self._content_buffer[-1].merge_in_place(part):
                     self._content_buffer.append(part)
+            case StepBegin() | StepInterrupted():
+                self.flush()
             case ToolCall() as call:
-                self._tool_call_buffer[call.id] = JsonPrinter._ToolCallState(
-                    tool_call=call, tool_result=None
-                )
+                self._tool_call_indices[call.id] = len(self._tool_calls)
+                self._tool_calls.append(call)
+                self._tool_results.append(None)
                 self._last_tool_call = call
             case ToolCallPart() as part:
                 if self._last_tool_call is None:
                     return
                 assert self._last_tool_call.merge_in_place(part)
             case ToolResult() as result:
-                state = self._tool_call_buffer.get(result.tool_call_id)
-                if state is None:
+                index = self._tool_call_indices.get(result.tool_call_id)
+                if index is None:
                     return
-                state.tool_result = result
+                self._tool_results[index] = result
             case _:
                 # ignore other messages
                 pass
 
     def flush(self) -> None:
-        if not self._content_buffer and not self._tool_call_buffer:
+        if not self._content_buffer and not self._tool_calls:
             return
 
         tool_calls: list[ToolCall] = []
         tool_results: list[ToolResult] = []
-        for state in self._tool_call_buffer.values():
-            if state.tool_result is None:
+        for tool_call, tool_result in zip(self._tool_calls, self._tool_results, strict=True):
+            if tool_result is None:
                 # this should only happen when interrupted
                 continue
-            tool_calls.append(state.tool_call)
-            tool_results.append(state.tool_result)
-
-        message = Message(
-            role="assistant",
-            content=self._content_buffer,
-            tool_calls=tool_calls or None,
-        )
-        print(message.model_dump_json(exclude_none=True), flush=True)
-
-        for result in tool_results:
-            # FIXME: this assumes the way how the soul convert `ToolResult` to `Message`
-            message = tool_result_to_message(result)
-            print(message.model_dump_json(exclude_none=True), flush=True)
+            tool_calls.append(tool_call)
+            tool_results.append(tool_result)
+
+        messages = [
+            Message(
+                role="assistant",
+                content=self._content_buffer,
+                tool_calls=tool_calls or None,
+            )
+        ]
+        # FIXME: this assumes the way how the soul convert `ToolResult` to `Message`
+        messages.extend(map(tool_result_to_message, tool_results))
+        # write and flush the whole step at once, instead of once per message
+        sys.stdout.write("".join(f"{m.model_dump_json(exclude_none=True)}\n" for m in messages))
+        sys.stdout.flush()
 
         self._content_buffer.clear()
-        self._tool_call_buffer.clear()
+        self._tool_calls.clear()
+        self._tool_results.clear()
+        self._tool_call_indices.clear()
 
 
 async def visualize(output_format: OutputFormat, wire: Wire) -> None:
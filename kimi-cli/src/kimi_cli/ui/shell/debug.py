@@ -158,29 +158,23 @@ def debug(app: Shell, args: list[str]):
         )
         return
 
-    # Build the debug output
-    output_items = [
-        Panel(
-            Group(
-                Text(f"Total messages: {len(history)}", style="bold"),
-                Text(f"Token count: {context.token_count:,}", style="bold"),
-                Text(f"Checkpoints: {context.n_checkpoints}", style="bold"),
-                Text(f"Trajectory: {context.file_backend}", style="dim"),
-            ),
-            title="[bold]Context Info[/bold]",
-            border_style="cyan",
-            padding=(0, 1),
-        ),
-        Rule(style="dim"),
-    ]
-
-    # Add all messages
-    for idx, msg in enumerate(history):
-        output_items.append(_format_message(msg, idx))
-
-    # Display using rich pager
-    display_group = Group(*output_items)
-
     # Use pager to display
     with console.pager(styles=True):
-        console.print(display_group)
+        console.print(
+            Panel(
+                Group(
+                    Text(f"Total messages: {len(history)}", style="bold"),
+                    Text(f"Token count: {context.token_count:,}", style="bold"),
+                    Text(f"Checkpoints: {context.n_checkpoints}", style="bold"),
+                    Text(f"Trajectory: {context.file_backend}", style="dim"),
+                ),
+                title="[bold]Context Info[/bold]",
+                border_style="cyan",
+                padding=(0, 1),
+            )
+        )
+        console.print(Rule(style="dim"))
+
+        # render the messages one by one, instead of building them all up front
+        for idx, msg in enumerate(history):
+            console.print(_format_message(msg, idx))
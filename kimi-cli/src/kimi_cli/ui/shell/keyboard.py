@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import sys
 import threading
 import time
 from collections.abc import AsyncGenerator, Callable
+from contextlib import aclosing
 from enum import Enum, auto
 
 
@@ -19,6 +21,115 @@ class KeyEvent(Enum):
 
 
 async def listen_for_keyboard() -> AsyncGenerator[KeyEvent]:
+    if sys.platform == "win32":
+        events = _listen_for_keyboard_windows_thread()
+    else:
+        events = _listen_for_keyboard_unix()
+    # close the listener (and restore the terminal) as soon as the caller stops listening
+    async with aclosing(events):
+        async for event in events:
+            yield event
+
+
+async def _listen_for_keyboard_unix() -> AsyncGenerator[KeyEvent]:
+    if sys.platform == "win32":
+        raise RuntimeError("Unix keyboard listener requires a non-Windows platform")
+
+    import termios
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue[KeyEvent]()
+
+    # make stdin raw and non-blocking
+    try:
+        fd = sys.stdin.fileno()
+        oldterm = termios.tcgetattr(fd)
+    except (OSError, ValueError, termios.error):
+        # stdin is not a terminal, there are no keys to listen for
+        return
+    newattr = termios.tcgetattr(fd)
+    newattr[3] = newattr[3] & ~termios.ICANON & ~termios.ECHO
+    newattr[6][termios.VMIN] = 0
+    newattr[6][termios.VTIME] = 0
+    termios.tcsetattr(fd, termios.TCSANOW, newattr)
+
+    reader = _UnixByteReader(fd)
+
+    def on_readable() -> None:
+        c = reader.read_byte()
+        if not c:
+            # stdin is closed, which would be reported as readable forever
+            loop.remove_reader(fd)
+            return
+        # handle everything that is available, e.g. a whole paste, in one go
+        while c:
+            event = _parse_unix_key(c, reader.read_byte)
+            if event is not None:
+                queue.put_nowait(event)
+            c = reader.read_byte()
+
+    # stdin is watched by the event loop itself, no thread is needed
+    loop.add_reader(fd, on_readable)
+    try:
+        while True:
+            yield await queue.get()
+    finally:
+        loop.remove_reader(fd)
+        # restore the terminal settings
+        termios.tcsetattr(fd, termios.TCSAFLUSH, oldterm)
+
+
+class _UnixByteReader:
+    """Reads stdin in chunks, and hands the bytes out one by one."""
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+        self._buffer = b""
+        self._pos = 0
+
+    def read_byte(self) -> bytes:
+        """Get the next byte, or `b""` if there is no input available right now."""
+        if self._pos >= len(self._buffer):
+            # never blocks, as `VMIN` and `VTIME` are 0
+            try:
+                self._buffer = os.read(self._fd, _READ_SIZE)
+            except OSError:
+                self._buffer = b""
+            self._pos = 0
+            if not self._buffer:
+                return b""
+        c = self._buffer[self._pos : self._pos + 1]
+        self._pos += 1
+        return c
+
+
+def _parse_unix_key(c: bytes, read_byte: Callable[[], bytes]) -> KeyEvent | None:
+    """Parse the key starting with byte `c`, reading the rest of an escape sequence if any."""
+    if c == b"\x1b":
+        return _parse_escape_sequence(read_byte)
+    if c in (b"\r", b"\n"):
+        return KeyEvent.ENTER
+    if c == b"\t":
+        return KeyEvent.TAB
+    return None
+
+
+def _parse_escape_sequence(read_byte: Callable[[], bytes]) -> KeyEvent | None:
+    """
+    Parse the rest of an escape sequence after `ESC`, which is a lone `ESC` key press if nothing
+    follows. At most two more bytes are read, like the longest sequence we know of.
+    """
+    second = read_byte()
+    if not second:
+        return KeyEvent.ESCAPE
+    final = read_byte()
+    if second == b"[" and final:
+        return _CSI_FINAL_KEYS[final[0]]
+    return None
+
+
+async def _listen_for_keyboard_windows_thread() -> AsyncGenerator[KeyEvent]:
+    # the console input cannot be watched by the event loop on Windows, so use a thread
     loop = asyncio.get_running_loop()
     queue = asyncio.Queue[KeyEvent]()
     cancel_event = threading.Event()
@@ -28,7 +139,7 @@ async def listen_for_keyboard() -> AsyncGenerator[KeyEvent]:
         loop.call_soon_threadsafe(queue.put_nowait, event)
 
     listener = threading.Thread(
-        target=_listen_for_keyboard_thread,
+        target=_listen_for_keyboard_windows,
         args=(cancel_event, emit),
         name="kimi-cli-keyboard-listener",
         daemon=True,
@@ -44,76 +155,6 @@ async def listen_for_keyboard() -> AsyncGenerator[KeyEvent]:
             await asyncio.to_thread(listener.join)
 
 
-def _listen_for_keyboard_thread(
-    cancel: threading.Event,
-    emit: Callable[[KeyEvent], None],
-) -> None:
-    if sys.platform == "win32":
-        _listen_for_keyboard_windows(cancel, emit)
-    else:
-        _listen_for_keyboard_unix(cancel, emit)
-
-
-def _listen_for_keyboard_unix(
-    cancel: threading.Event,
-    emit: Callable[[KeyEvent], None],
-) -> None:
-    if sys.platform == "win32":
-        raise RuntimeError("Unix keyboard listener requires a non-Windows platform")
-
-    import termios
-
-    # make stdin raw and non-blocking
-    fd = sys.stdin.fileno()
-    oldterm = termios.tcgetattr(fd)
-    newattr = termios.tcgetattr(fd)
-    newattr[3] = newattr[3] & ~termios.ICANON & ~termios.ECHO
-    newattr[6][termios.VMIN] = 0
-    newattr[6][termios.VTIME] = 0
-    termios.tcsetattr(fd, termios.TCSANOW, newattr)
-
-    try:
-        while not cancel.is_set():
-            try:
-                c = sys.stdin.buffer.read(1)
-            except (OSError, ValueError):
-                c = b""
-
-            if not c:
-                if cancel.is_set():
-                    break
-                time.sleep(0.01)
-                continue
-
-            if c == b"\x1b":
-                sequence = c
-                for _ in range(2):
-                    if cancel.is_set():
-                        break
-                    try:
-                        fragment = sys.stdin.buffer.read(1)
-                    except (OSError, ValueError):
-                        fragment = b""
-                    if not fragment:
-                        break
-                    sequence += fragment
-                    if sequence in _ARROW_KEY_MAP:
-                        break
-
-                event = _ARROW_KEY_MAP.get(sequence)
-                if event is not None:
-                    emit(event)
-                elif sequence == b"\x1b":
-                    emit(KeyEvent.ESCAPE)
-            elif c in (b"\r", b"\n"):
-                emit(KeyEvent.ENTER)
-            elif c == b"\t":
-                emit(KeyEvent.TAB)
-    finally:
-        # restore the terminal settings
-        termios.tcsetattr(fd, termios.TCSAFLUSH, oldterm)
-
-
 def _listen_for_keyboard_windows(
     cancel: threading.Event,
     emit: Callable[[KeyEvent], None],
@@ -121,45 +162,52 @@ def _listen_for_keyboard_windows(
     if sys.platform != "win32":
         raise RuntimeError("Windows keyboard listener requires a Windows platform")
 
+    import ctypes
     import msvcrt
 
+    kernel32 = ctypes.windll.kernel32
+    stdin_handle = kernel32.GetStdHandle(_STD_INPUT_HANDLE)
+
     while not cancel.is_set():
-        if msvcrt.kbhit():
-            c = msvcrt.getch()
-
-            # Handle special keys (arrow keys, etc.)
-            if c in (b"\x00", b"\xe0"):
-                # Extended key, read the next byte
-                extended = msvcrt.getch()
-                event = _WINDOWS_KEY_MAP.get(extended)
-                if event is not None:
-                    emit(event)
-            elif c == b"\x1b":
-                sequence = c
-                for _ in range(2):
-                    if cancel.is_set():
-                        break
-                    fragment = msvcrt.getch() if msvcrt.kbhit() else b""
-                    if not fragment:
-                        break
-                    sequence += fragment
-                    if sequence in _ARROW_KEY_MAP:
-                        break
-
-                event = _ARROW_KEY_MAP.get(sequence)
-                if event is not None:
-                    emit(event)
-                elif sequence == b"\x1b":
-                    emit(KeyEvent.ESCAPE)
-            elif c in (b"\r", b"\n"):
-                emit(KeyEvent.ENTER)
-            elif c == b"\t":
-                emit(KeyEvent.TAB)
-        else:
-            if cancel.is_set():
-                break
-            time.sleep(0.01)
+        if not msvcrt.kbhit():
+            # sleep until there is console input, waking up regularly to check for cancellation
+            result = kernel32.WaitForSingleObject(stdin_handle, _WAIT_TIMEOUT_MS)
+            if result == _WAIT_TIMEOUT:
+                continue
+            if result != _WAIT_OBJECT_0 or not msvcrt.kbhit():
+                # the wait failed, or the input is not a key press (e.g. focus or mouse events),
+                # which wakes the wait up without `kbhit` seeing it, so do not spin on it
+                time.sleep(0.01)
+                continue
 
+        # keys already in the buffer (e.g. from a paste) are read without waiting again
+        c = msvcrt.getch()
+
+        # Handle special keys (arrow keys, etc.)
+        if c in (b"\x00", b"\xe0"):
+            # Extended key, read the next byte
+            extended = msvcrt.getch()
+            event = _WINDOWS_KEY_MAP.get(extended)
+            if event is not None:
+                emit(event)
+        elif c == b"\x1b":
+            event = _parse_escape_sequence(lambda: msvcrt.getch() if msvcrt.kbhit() else b"")
+            if event is not None:
+                emit(event)
+        elif c in (b"\r", b"\n"):
+            emit(KeyEvent.ENTER)
+        elif c == b"\t":
+            emit(KeyEvent.TAB)
+
+
+_READ_SIZE = 64
+
+# Win32 constants for waiting on the console input
+_STD_INPUT_HANDLE = -10
+_WAIT_OBJECT_0 = 0x0
+_WAIT_TIMEOUT = 0x102
+_WAIT_TIMEOUT_MS = 50
+"""Milliseconds between checks for cancellation while waiting for input."""
 
 _ARROW_KEY_MAP: dict[bytes, KeyEvent] = {
     b"\x1b[A": KeyEvent.UP,
@@ -168,6 +216,11 @@ _ARROW_KEY_MAP: dict[bytes, KeyEvent] = {
     b"\x1b[D": KeyEvent.LEFT,
 }
 
+_CSI_FINAL_KEYS: tuple[KeyEvent | None, ...] = tuple(
+    _ARROW_KEY_MAP.get(b"\x1b[" + bytes([final])) for final in range(256)
+)
+"""The keys of `ESC [ <final>` sequences, indexed by the final byte."""
+
 _WINDOWS_KEY_MAP: dict[bytes, KeyEvent] = {
     b"H": KeyEvent.UP,  # Up arrow
     b"P": KeyEvent.DOWN,  # Down arrow
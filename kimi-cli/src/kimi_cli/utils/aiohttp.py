@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import ssl
 
 import aiohttp
@@ -7,6 +8,52 @@ import certifi
 
 _ssl_context = ssl.create_default_context(cafile=certifi.where())
 
+_KEEPALIVE_TIMEOUT = 30.0
+"""Seconds to keep an idle connection in the shared session's pool."""
+_LIMIT_PER_HOST = 16
+"""Maximum number of simultaneous connections to one host in the shared session's pool."""
+_DNS_CACHE_TTL = 300
+"""Seconds to cache resolved host addresses in the shared session."""
+
 
 def new_client_session() -> aiohttp.ClientSession:
     return aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=_ssl_context))
+
+
+_shared_session: tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession] | None = None
+
+
+def shared_client_session() -> aiohttp.ClientSession:
+    """
+    Get the client session shared by the tools running in the current event loop, so that
+    connections (and their DNS lookups and TLS handshakes) are reused across tool calls.
+
+    Callers must not close the session, see `close_shared_client_session` instead.
+    """
+    global _shared_session
+    loop = asyncio.get_running_loop()
+    if _shared_session is not None:
+        session_loop, session = _shared_session
+        if session_loop is loop and not session.closed:
+            return session
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            ssl=_ssl_context,
+            limit_per_host=_LIMIT_PER_HOST,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=_DNS_CACHE_TTL,
+        )
+    )
+    _shared_session = (loop, session)
+    return session
+
+
+async def close_shared_client_session() -> None:
+    """Close the shared client session, if it was created in the current event loop."""
+    global _shared_session
+    if _shared_session is None:
+        return
+    session_loop, session = _shared_session
+    if session_loop is asyncio.get_running_loop():
+        _shared_session = None
+        await session.close()
@@ -27,12 +27,15 @@ async def _reserve_rotation_path(path: Path) -> bool:
     return True
 
 
-async def next_available_rotation(path: Path) -> Path | None:
+async def next_available_rotation(path: Path, *, start: int | None = None) -> Path | None:
     """Return a reserved rotation path for *path* or ``None`` if parent is missing.
 
     The caller must overwrite/reuse the returned path immediately because this helper
     commits an empty placeholder file to guarantee uniqueness. It is therefore suited
     for rotating *files* (like history logs) but **not** directory creation.
+
+    If *start* is given, e.g. one past a number previously returned for the same *path*,
+    rotation numbers are probed from there instead of after the highest one in the directory.
     """
 
     if not path.parent.exists():
@@ -40,13 +43,16 @@ async def next_available_rotation(path: Path) -> Path | None:
 
     base_name = path.stem
     suffix = path.suffix
-    pattern = re.compile(rf"^{re.escape(base_name)}_(\d+){re.escape(suffix)}$")
-    max_num = 0
-    for entry in await aiofiles.os.listdir(path.parent):
-        if match := pattern.match(entry):
-            max_num = max(max_num, int(match.group(1)))
+    if start is not None:
+        next_num = start
+    else:
+        pattern = re.compile(rf"^{re.escape(base_name)}_(\d+){re.escape(suffix)}$")
+        max_num = 0
+        for entry in await aiofiles.os.listdir(path.parent):
+            if match := pattern.match(entry):
+                max_num = max(max_num, int(match.group(1)))
+        next_num = max_num + 1
 
-    next_num = max_num + 1
     while True:
         next_path = path.parent / f"{base_name}_{next_num}{suffix}"
         if await _reserve_rotation_path(next_path):
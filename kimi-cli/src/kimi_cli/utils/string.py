@@ -12,6 +12,12 @@ def shorten_middle(text: str, width: int, remove_newline: bool = True) -> str:
     if len(text) <= width:
         return text
     if remove_newline:
+        # only both ends survive, so collapse newlines there instead of in the whole text, unless
+        # so many newlines collapse that the ends no longer cover the kept characters
+        head = _NEWLINE_RE.sub(" ", text[:width])
+        tail = _NEWLINE_RE.sub(" ", text[-width:])
+        if min(len(head), len(tail)) > width - width // 2:
+            return head[: width // 2] + "..." + tail[-width // 2 :]
         text = _NEWLINE_RE.sub(" ", text)
     return text[: width // 2] + "..." + text[-width // 2 :]
 
@@ -119,6 +119,18 @@ class WireUISide:
             logger.debug("Receiving wire message: {msg}", msg=msg)
         return msg
 
+    def receive_nowait(self) -> WireMessage:
+        """
+        Receive a message that is already queued.
+
+        Raises:
+            asyncio.QueueEmpty: If no message is queued.
+        """
+        msg = self._queue.get_nowait()
+        if not isinstance(msg, ContentPart | ToolCallPart):
+            logger.debug("Receiving wire message: {msg}", msg=msg)
+        return msg
+
 
 class _WireRecorder:
     def __init__(self, file_backend: Path, queue: asyncio.Queue[WireMessage]) -> None:
@@ -128,15 +140,24 @@ class _WireRecorder:
     async def _consume_loop(self, queue: asyncio.Queue[WireMessage]) -> None:
         while True:
             try:
-                msg = await queue.get()
-                await self._record(msg)
+                msgs = [await queue.get()]
             except asyncio.QueueShutDown:
                 break
-
-    async def _record(self, msg: WireMessage) -> None:
-        record = {
-            "timestamp": time.time(),
-            "message": serialize_wire_message(msg),
-        }
+            # drain what is already queued so that a burst of messages is recorded in one write
+            while True:
+                try:
+                    msgs.append(queue.get_nowait())
+                except (asyncio.QueueEmpty, asyncio.QueueShutDown):
+                    break
+            await self._record(msgs)
+
+    async def _record(self, msgs: list[WireMessage]) -> None:
+        lines: list[str] = []
+        for msg in msgs:
+            record = {
+                "timestamp": time.time(),
+                "message": serialize_wire_message(msg),
+            }
+            lines.append(json.dumps(record, ensure_ascii=False) + "\n")
         async with aiofiles.open(self._file_backend, mode="a", encoding="utf-8") as f:
-            await f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            await f.write("".join(lines))
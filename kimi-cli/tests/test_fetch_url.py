@@ -205,6 +205,45 @@ This is a markdown document.
     assert result.output == snapshot(complex_markdown)
     assert result.message == "The returned content is the full content of the page."
 
+    # binary content is rejected without being downloaded
+    result = await mocked_fetch("%PDF-1.4", content_type="application/pdf")
+    assert isinstance(result, ToolError)
+    assert result.message == snapshot(
+        "Failed to fetch URL. Unsupported content type: application/pdf. Only text, HTML, JSON, XML and JavaScript pages can be fetched."
+    )
+
+    # JSON and XML documents are returned as they are
+    for body, content_type in [
+        ('{"key": "value"}', "application/json"),
+        ('<?xml version="1.0"?><rss><channel></channel></rss>', "application/rss+xml"),
+    ]:
+        result = await mocked_fetch(body, content_type=content_type)
+        assert isinstance(result, ToolOk)
+        assert result.output == body
+        assert result.message == "The returned content is the full content of the page."
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_truncated_body(
+    fetch_url_tool: FetchURL,
+    mock_http_server: MockServerFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a body cut at the size limit is reported as such."""
+    monkeypatch.setattr("kimi_cli.tools.web.fetch._MAX_BODY_BYTES", 16)
+
+    server_url = await mock_http_server("a" * 16, content_type="text/plain")
+    result = await fetch_url_tool(Params(url=f"{server_url}/"))
+    assert isinstance(result, ToolOk)
+    assert result.output == "a" * 16
+    assert result.message == "The returned content is the full content of the page."
+
+    server_url = await mock_http_server("a" * 17, content_type="text/plain")
+    result = await fetch_url_tool(Params(url=f"{server_url}/"))
+    assert isinstance(result, ToolOk)
+    assert result.output == "a" * 16
+    assert "the rest was not fetched" in result.message
+
 
 @pytest.mark.asyncio
 async def test_fetch_url_with_service() -> None:
@@ -273,3 +312,54 @@ async def test_fetch_url_with_service() -> None:
 
     finally:
         await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_cache(fetch_url_tool: FetchURL, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that repeated fetches of a URL are served from the cache until they expire."""
+    fetched: list[str] = []
+
+    async def fake_fetch(self: FetchURL, params: Params) -> ToolReturnValue:
+        fetched.append(params.url)
+        return ToolOk(output=f"fetch {len(fetched)}", message="Fetched.")
+
+    monkeypatch.setattr(FetchURL, "_fetch", fake_fetch)
+
+    # a cache hit says that the content is cached
+    result = await fetch_url_tool(Params(url="https://example.com/a"))
+    assert isinstance(result, ToolOk)
+    assert result.message == "Fetched."
+    result = await fetch_url_tool(Params(url="https://example.com/a"))
+    assert isinstance(result, ToolOk)
+    assert result.output == "fetch 1"
+    assert result.message.startswith("Fetched. The content is cached from a fetch")
+    assert fetched == ["https://example.com/a"]
+
+    # the least recently used result is evicted
+    monkeypatch.setattr("kimi_cli.tools.web.fetch._CACHE_MAX_SIZE", 2)
+    await fetch_url_tool(Params(url="https://example.com/b"))
+    await fetch_url_tool(Params(url="https://example.com/a"))
+    await fetch_url_tool(Params(url="https://example.com/c"))
+    await fetch_url_tool(Params(url="https://example.com/a"))
+    await fetch_url_tool(Params(url="https://example.com/b"))
+    assert fetched == [
+        "https://example.com/a",
+        "https://example.com/b",
+        "https://example.com/c",
+        "https://example.com/b",
+    ]
+
+    # expired results are fetched again
+    monkeypatch.setattr("kimi_cli.tools.web.fetch._CACHE_TTL", 0.0)
+    result = await fetch_url_tool(Params(url="https://example.com/b"))
+    assert isinstance(result, ToolOk)
+    assert result.message == "Fetched."
+    assert fetched[-1] == "https://example.com/b"
+    assert len(fetched) == 5
+
+    # pages served locally are never cached
+    monkeypatch.setattr("kimi_cli.tools.web.fetch._CACHE_TTL", 300.0)
+    for url in ["http://localhost:8000/", "http://127.0.0.1:8000/", "http://192.168.1.2/"]:
+        await fetch_url_tool(Params(url=url))
+        await fetch_url_tool(Params(url=url))
+        assert fetched[-2:] == [url, url]
@@ -67,6 +67,18 @@ async def test_glob_recursive_pattern_prohibited(glob_tool: Glob, test_files: Ka
     assert "Unsafe pattern" in result.brief
 
 
+@pytest.mark.asyncio
+async def test_glob_wildcard_prefixed_recursive_pattern_prohibited(
+    glob_tool: Glob, test_files: KaosPath
+):
+    """Test that recursive glob pattern with only wildcards before ** is prohibited."""
+    result = await glob_tool(Params(pattern="*/**/*.py", directory=str(test_files)))
+
+    assert isinstance(result, ToolError)
+    assert "only has wildcards before '**'" in result.message
+    assert "Unsafe pattern" in result.brief
+
+
 @pytest.mark.asyncio
 async def test_glob_safe_recursive_pattern(glob_tool: Glob, test_files: KaosPath):
     """Test safe recursive glob pattern that doesn't start with **/."""
@@ -230,7 +242,7 @@ async def test_glob_max_matches_limit(glob_tool: Glob, temp_work_dir: KaosPath):
     output_lines = [line for line in result.output.split("\n") if line.strip()]
     assert len(output_lines) == MAX_MATCHES
     # Should contain warning message
-    assert f"Only the first {MAX_MATCHES} matches are returned" in result.message
+    assert f"Only {MAX_MATCHES} of the matches are returned" in result.message
 
 
 @pytest.mark.asyncio
@@ -268,7 +280,7 @@ async def test_glob_exactly_max_matches(glob_tool: Glob, temp_work_dir: KaosPath
     output_lines = [line for line in result.output.split("\n") if line.strip()]
     assert len(output_lines) == MAX_MATCHES
     # Should NOT contain warning message since we have exactly MAX_MATCHES
-    assert "Only the first" not in result.message
+    assert "of the matches are returned" not in result.message
     assert f"Found {MAX_MATCHES} matches" in result.message
 
 
@@ -395,3 +395,21 @@ async def test_grep_before_after_context(grep_tool: Grep, temp_test_files):
     assert "constructor()" in result.output
     assert "this.message" in result.output
     assert "}" not in result.output
+
+
+@pytest.mark.asyncio
+async def test_grep_overlong_line(grep_tool: Grep):
+    """A matching line too long to stream is reported instead of silently dropped."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_file = Path(temp_dir) / "huge.txt"
+        test_file.write_text("needle " + "x" * (2 * 1024 * 1024) + "\nshort needle\n")
+
+        result = await grep_tool(
+            Params.model_validate(
+                {"pattern": "needle", "path": temp_dir, "output_mode": "content", "-n": True}
+            )
+        )
+        assert isinstance(result, ToolOk)
+        assert isinstance(result.output, str)
+        assert "was omitted" in result.output
+        assert "short needle" in result.output
@@ -245,3 +245,19 @@ async def test_replace_empty_strings(
     assert isinstance(result, ToolOk)
     assert "successfully edited" in result.message
     assert await file_path.read_text() == "Hello !"
+
+
+@pytest.mark.asyncio
+async def test_replace_multiline_in_crlf_file(
+    str_replace_file_tool: StrReplaceFile, temp_work_dir: KaosPath
+):
+    """Test that a multi-line old string as shown by ReadFile matches a CRLF file."""
+    file_path = temp_work_dir / "test.txt"
+    await file_path.write_bytes(b"line one\r\nline two\r\nline three\r\n")
+
+    result = await str_replace_file_tool(
+        Params(path=str(file_path), edit=Edit(old="line one\nline two", new="first\nsecond"))
+    )
+
+    assert isinstance(result, ToolOk)
+    assert await file_path.read_text() == "first\nsecond\nline three\n"
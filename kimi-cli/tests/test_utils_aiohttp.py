@@ -0,0 +1,21 @@
+"""Tests for aiohttp utility functions."""
+
+from __future__ import annotations
+
+import pytest
+
+from kimi_cli.utils.aiohttp import close_shared_client_session, shared_client_session
+
+
+@pytest.mark.asyncio
+async def test_shared_client_session_is_reused():
+    """Test that the shared session is reused until it is closed."""
+    session = shared_client_session()
+    assert shared_client_session() is session
+
+    await close_shared_client_session()
+    assert session.closed
+
+    new_session = shared_client_session()
+    assert new_session is not session
+    await close_shared_client_session()
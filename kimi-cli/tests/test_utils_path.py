@@ -235,3 +235,15 @@ async def test_next_available_rotation_concurrent_calls(tmp_path):
         "events_4.log",
         "events_5.log",
     }
+
+
+@pytest.mark.asyncio
+async def test_next_available_rotation_with_start(tmp_path):
+    """Probing from a start number skips existing rotations without listing them."""
+
+    (tmp_path / "log_1.txt").write_text("content1")
+    (tmp_path / "log_3.txt").write_text("content3")
+
+    target = tmp_path / "log.txt"
+    assert await next_available_rotation(target, start=2) == tmp_path / "log_2.txt"
+    assert await next_available_rotation(target, start=3) == tmp_path / "log_4.txt"